@@ -3,6 +3,7 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 import re
+import struct
 from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 from .hub_versions import HUB_VERSION_X1, HUB_VERSION_X1S, HUB_VERSION_X2
@@ -253,10 +254,11 @@ def iter_keymap_records(
 
     usable = len(concat) - (len(concat) % KEYMAP_RECORD_SIZE)
     for start in range(0, usable, KEYMAP_RECORD_SIZE):
-        record = KeymapRecord(raw=bytes(concat[start : start + KEYMAP_RECORD_SIZE]))
-        if expected_activity_id is not None and record.activity_id != expected_activity_id:
+        # Filter on the activity byte before slicing so skipped strides
+        # never allocate a record.
+        if expected_activity_id is not None and concat[start] != expected_activity_id:
             continue
-        yield record
+        yield KeymapRecord(raw=bytes(concat[start : start + KEYMAP_RECORD_SIZE]))
 
 
 @dataclass(slots=True, frozen=True)
@@ -413,22 +415,24 @@ def iter_command_records_from_assembled(
     stride, label_len, encoding = _stride_and_label_len(hub_version)
     label_end = COMMAND_RECORD_LABEL_OFFSET + label_len
 
+    body_len = len(body)
     for i in range(count):
         start = i * stride
         end = start + stride
-        if end > len(body):
+        if end > body_len:
             return  # truncated body; caller can detect via returned-count diff
-        record = body[start:end]
 
-        label_bytes = record[COMMAND_RECORD_LABEL_OFFSET:label_end]
+        # Slice fields straight out of ``body``; copying the whole record
+        # first would allocate a stride-sized buffer per command.
+        label_bytes = body[start + COMMAND_RECORD_LABEL_OFFSET : start + label_end]
         label = _decode_schema_label(label_bytes, encoding)
 
         yield CommandRecord(
-            dev_id=record[0],
-            command_id=record[1],
-            control=bytes(record[2 : COMMAND_RECORD_LABEL_OFFSET]),
+            dev_id=body[start],
+            command_id=body[start + 1],
+            control=bytes(body[start + 2 : start + COMMAND_RECORD_LABEL_OFFSET]),
             label=label,
-            sort_id=record[stride - 1] & 0xFF,
+            sort_id=body[end - 1] & 0xFF,
         )
 
 
@@ -451,6 +455,12 @@ def _command_hub_line(hub_version: str) -> str:
     return "x1" if hub_version == HUB_VERSION_X1 else "x1s_x2"
 
 
+# Burst page header: ``<2 bytes> frame_no <1 byte> total_frames(be16)``.
+_BURST_PAGE_HDR = struct.Struct(">2xBxH")
+# DEVBTN page-1 header: the page header followed by ``total_commands device_id``.
+_DEVBTN_HDR = struct.Struct(">2xBxHBB")
+
+
 def parse_button_burst_frame(
     opcode: int,
     raw_frame: bytes,
@@ -472,9 +482,11 @@ def parse_button_burst_frame(
     if len(payload) < 3 or not _is_keymap_family(opcode):
         return None
 
-    frame_no = payload[2]
     hinted_line = _button_hub_line(hub_version)
-    total_frames = int.from_bytes(payload[4:6], "big") if len(payload) >= 6 else None
+    if len(payload) >= 6:
+        frame_no, total_frames = _BURST_PAGE_HDR.unpack_from(payload)
+    else:
+        frame_no, total_frames = payload[2], None
     if total_frames == 0:
         total_frames = None
     total_rows = payload[6] if frame_no == 1 and len(payload) > 6 and payload[6] > 0 else None
@@ -648,6 +660,7 @@ def parse_command_burst_frame(
         return None
 
     if frame_no == 1 and len(payload) > 7 and payload[4] == 0x00:
+        _, total_frames, total_commands, device_id = _DEVBTN_HDR.unpack_from(payload)
         layout_kind = "shared_classic"
         if hinted_line == "x1":
             layout_kind = "x1_classic"
@@ -659,9 +672,9 @@ def parse_command_burst_frame(
             layout_kind=layout_kind,
             role="header",
             frame_no=frame_no,
-            device_id=payload[7],
-            total_frames=int.from_bytes(payload[4:6], "big"),
-            total_commands=payload[6],
+            device_id=device_id,
+            total_frames=total_frames,
+            total_commands=total_commands,
             data_start=7,
             first_command_id=payload[8] if len(payload) > 8 else None,
             format_marker=payload[9] if len(payload) > 9 else None,
@@ -1058,11 +1071,8 @@ class DeviceCommandAssembler:
     ) -> List[Tuple[int, bytes]]:
         """Feed a raw frame and return completed payloads when available."""
 
-        if len(raw_frame) < 7:
-            return []
-
-        payload = raw_frame[4:-1]
-        if len(payload) < 4:
+        # Header (4) + at least 4 payload bytes + checksum (1).
+        if len(raw_frame) < 9:
             return []
 
         parsed = parse_command_burst_frame(opcode, raw_frame, hub_version=hub_version)
@@ -1088,17 +1098,12 @@ class DeviceCommandAssembler:
             burst.variant = parsed.layout_kind
             burst.total_frames = 1
 
-        frame_payload = payload[parsed.data_start :] if len(payload) > parsed.data_start else b""
-        burst.frames[frame_no] = frame_payload
+        # Slice the record bytes straight out of the frame (payload is
+        # raw_frame[4:-1]) rather than copying the payload first.
+        data_start = 4 + parsed.data_start
+        burst.frames[frame_no] = raw_frame[data_start:-1] if len(raw_frame) - 1 > data_start else b""
 
         completed: List[Tuple[int, bytes]] = []
-        if burst.frames:
-            max_frame_no = max(burst.frames)
-            frames_are_contiguous = len(burst.frames) == max_frame_no and 1 in burst.frames
-        else:
-            max_frame_no = 0
-            frames_are_contiguous = False
-
         if is_single_cmd:
             ordered_payload = b"".join(burst.frames[i] for i in sorted(burst.frames))
             completed.append((dev_id, ordered_payload))
@@ -1161,7 +1166,6 @@ class DeviceButtonAssembler:
         if len(raw_frame) < 7:
             return []
 
-        payload = raw_frame[4:-1]
         parsed = parse_button_burst_frame(opcode, raw_frame, hub_version=hub_version)
         if parsed is None:
             return []
@@ -1189,10 +1193,12 @@ class DeviceButtonAssembler:
             if burst.total_frames is None and parsed.is_final:
                 burst.total_frames = parsed.frame_no
 
-        frame_payload = (
-            payload[parsed.data_start:] if parsed.has_row_data and len(payload) > parsed.data_start else b""
+        data_start = 4 + parsed.data_start
+        burst.frames[parsed.frame_no] = (
+            raw_frame[data_start:-1]
+            if parsed.has_row_data and len(raw_frame) - 1 > data_start
+            else b""
         )
-        burst.frames[parsed.frame_no] = frame_payload
 
         completed: List[Tuple[int, bytes, int | None]] = []
         if burst.total_frames and burst.received >= burst.total_frames:
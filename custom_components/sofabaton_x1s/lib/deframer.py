@@ -15,6 +15,30 @@ from typing import List, Optional, Tuple
 from .protocol_const import SYNC0, SYNC1
 
 
+# One decoded frame: (opcode, raw frame, payload, start chunk id, end chunk
+# id). Consumers unpack all five fields per frame, so frames stay a list
+# of small tuples rather than parallel per-field arrays.
+DeframedFrame = Tuple[int, bytes, bytes, int, int]
+
+
+def _find_sync(buf: bytes | bytearray, start: int = 0) -> int:
+    """Return the index of the next ``SYNC0 SYNC1`` pair at or after ``start``.
+
+    Scans for the lone ``SYNC0`` byte, which ``find`` hands to ``memchr``,
+    and checks the byte after each hit. ``SYNC0`` is rare in payloads
+    (padding and UTF-16 names are mostly ``0x00``), so this skips long runs
+    far faster than a two-byte substring search.
+    """
+
+    last = len(buf) - 1
+    idx = buf.find(SYNC0, start)
+    while 0 <= idx < last:
+        if buf[idx + 1] == SYNC1:
+            return idx
+        idx = buf.find(SYNC0, idx + 1)
+    return -1
+
+
 def _sum8(b: bytes) -> int:
     return sum(b) & 0xFF
 
@@ -24,50 +48,68 @@ class Deframer:
         self.buf = bytearray()
         self._cur_start_cid: Optional[int] = None
 
-    def feed(self, data: bytes, cid: int) -> List[Tuple[int, bytes, bytes, int, int]]:
-        out: List[Tuple[int, bytes, bytes, int, int]] = []
+    def feed(
+        self, data: bytes | bytearray | memoryview, cid: int
+    ) -> List[DeframedFrame]:
+        out: List[DeframedFrame] = []
         if not data:
             return out
-        self.buf.extend(data)
-        if len(self.buf) > 1_000_000:
-            del self.buf[:500_000]
-            self._cur_start_cid = None
-
-        while True:
-            if len(self.buf) < 2:
-                break
-            if self.buf[0] != SYNC0 or self.buf[1] != SYNC1:
-                idx = self.buf.find(bytes([SYNC0, SYNC1]))
-                if idx < 0:
-                    # Preserve a lone trailing SYNC0 across reads.
-                    if self.buf and self.buf[-1] == SYNC0:
-                        del self.buf[:-1]
-                    else:
-                        self.buf.clear()
+        buf = self.buf
+        if buf or type(data) is not bytes:
+            buf.extend(data)
+            src = buf
+        else:
+            # Nothing carried over: parse the read in place and only
+            # buffer whatever partial frame is left at the end. Other
+            # buffer types (e.g. a view into a reused receive buffer) take
+            # the branch above, since the caller may overwrite them.
+            src = data
+
+        # Walk the buffer with a cursor and trim the consumed prefix once at
+        # the end, instead of memmoving the tail after every frame. What is
+        # left is at most one partial frame (< 5 + 255 bytes), so the trim
+        # is bounded and a lazily compacted ring offset would not pay off.
+        # The same bound keeps the buffer from growing across reads, so no
+        # size cap is needed (junk without a sync pair is dropped below).
+        end = len(src)
+        pos = 0
+        with memoryview(src) as mv:
+            while end - pos >= 2:
+                if src[pos] != SYNC0 or src[pos + 1] != SYNC1:
+                    idx = _find_sync(src, pos)
                     self._cur_start_cid = None
+                    if idx < 0:
+                        # Preserve a lone trailing SYNC0 across reads.
+                        pos = end - 1 if src[end - 1] == SYNC0 else end
+                        break
+                    pos = idx
+
+                if end - pos < 5:
                     break
-                del self.buf[:idx]
-                self._cur_start_cid = None
+                if self._cur_start_cid is None:
+                    self._cur_start_cid = cid
 
-            if len(self.buf) < 5:
-                break
-            if self._cur_start_cid is None:
-                self._cur_start_cid = cid
+                nxt = pos + 5 + src[pos + 2]
+                if nxt > end:
+                    break
 
-            frame_len = 5 + self.buf[2]
-            if len(self.buf) < frame_len:
-                break
+                if src[nxt - 1] == _sum8(mv[pos : nxt - 1]):
+                    if nxt - pos == end and src is not buf:
+                        cand = src  # the read is exactly one frame
+                    else:
+                        cand = bytes(mv[pos:nxt])
+                    opcode = (cand[2] << 8) | cand[3]
+                    out.append((opcode, cand, cand[4:-1], self._cur_start_cid, cid))
+                    pos = nxt
+                    self._cur_start_cid = None
+                    continue
 
-            cand = bytes(self.buf[:frame_len])
-            if cand[-1] == (_sum8(cand[:-1]) & 0xFF):
-                opcode = (cand[2] << 8) | cand[3]
-                out.append((opcode, cand, cand[4:-1], self._cur_start_cid, cid))
-                del self.buf[:frame_len]
+                # Bad checksum at this sync: skip one byte and rescan.
+                pos += 1
                 self._cur_start_cid = None
-                continue
-
-            # Bad checksum at this sync: drop one byte and rescan.
-            del self.buf[0]
-            self._cur_start_cid = None
 
+            if src is not buf and pos < end:
+                buf.extend(mv[pos:])
+        if src is buf and pos:
+            del buf[:pos]
         return out
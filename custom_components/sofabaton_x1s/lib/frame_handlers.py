@@ -73,23 +73,58 @@ class BaseFrameHandler(FrameHandler):
         return opcode_match and direction_match
 
 
+class _DispatchTable(dict):
+    """``opcode -> handlers`` for one direction, filled on first lookup.
+
+    Indexing never raises: a miss runs ``matches`` over the registered
+    handlers once and stores the (possibly empty) tuple, so per-frame
+    dispatch is a single subscript.
+    """
+
+    __slots__ = ("_handlers", "_direction")
+
+    def __init__(self, handlers: list[FrameHandler], direction: str) -> None:
+        super().__init__()
+        self._handlers = handlers
+        self._direction = direction
+
+    def __missing__(self, opcode: int) -> tuple[FrameHandler, ...]:
+        matched = []
+        for handler in self._handlers:
+            try:
+                if handler.matches(opcode, self._direction):
+                    matched.append(handler)
+            except Exception:
+                continue
+        handlers = self[opcode] = tuple(matched)
+        return handlers
+
+
 class FrameHandlerRegistry:
     """Collection of registered handlers."""
 
     def __init__(self) -> None:
         self._handlers: list[FrameHandler] = []
+        self._dispatch: dict[str, _DispatchTable] = {}
 
     def register(self, handler: FrameHandler) -> FrameHandler:
         self._handlers.append(handler)
+        self._dispatch.clear()
         return handler
 
+    def table_for(self, direction: str) -> dict[int, tuple[FrameHandler, ...]]:
+        """Return the memoised ``opcode -> handlers`` table for ``direction``."""
+
+        table = self._dispatch.get(direction)
+        if table is None:
+            table = self._dispatch[direction] = _DispatchTable(self._handlers, direction)
+        return table
+
+    def handlers_for(self, opcode: int, direction: str) -> tuple[FrameHandler, ...]:
+        return self.table_for(direction)[opcode]
+
     def iter_for(self, opcode: int, direction: str) -> Iterator[FrameHandler]:
-        for handler in self._handlers:
-            try:
-                if handler.matches(opcode, direction):
-                    yield handler
-            except Exception:
-                continue
+        return iter(self.handlers_for(opcode, direction))
 
 
 frame_handler_registry = FrameHandlerRegistry()
@@ -9,6 +9,7 @@ import re
 from typing import Any
 
 _HUB_LOG_PREFIX_PATTERN = re.compile(r"^\[(?P<entry_id>[^\[\]]+)\]\s+")
+_LOG_TAG_TOKEN_PATTERN = re.compile(r"[A-Z_]+")
 
 
 class LogTag:
@@ -80,7 +81,7 @@ def extract_hub_log_entry_id(message: str) -> str | None:
     if not match:
         return None
     candidate = str(match.group("entry_id") or "").strip()
-    if re.fullmatch(r"[A-Z_]+", candidate):
+    if _LOG_TAG_TOKEN_PATTERN.fullmatch(candidate):
         return None
     return candidate or None
 
@@ -111,6 +112,10 @@ class HubLogger:
         return self._logger.isEnabledFor(level)
 
     def log(self, level: int, message: str, *args: Any, **kwargs: Any) -> None:
+        # Bail out before the prefix regexes run; the wrapped logger would
+        # drop the record anyway, and DEBUG-level frame logging is chatty.
+        if not self._logger.isEnabledFor(level):
+            return
         normalized_message = str(message or "")
         normalized_args = args
 
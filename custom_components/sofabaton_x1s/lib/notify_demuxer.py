@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import logging
 import ipaddress
+import select
 import socket
-import struct
 import threading
 import time
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Optional, Tuple
 
 from .hub_versions import HUB_VERSION_X1, HUB_VERSION_X1S, HUB_VERSION_X2, classify_hub_version
 from .hub_logging import get_hub_logger
@@ -17,6 +17,8 @@ log = logging.getLogger("x1proxy.notify")
 
 NOTIFY_ME_PAYLOAD = bytes.fromhex("a55a00c1c0")
 BROADCAST_LISTEN_PORT = 8100
+# Datagrams read per readiness wake before re-checking the stop flag.
+_MAX_DATAGRAMS_PER_WAKE = 32
 _NOTIFY_BATCH_BYTES: dict[str, bytes] = {
     HUB_VERSION_X1: bytes.fromhex("20210609"),
     HUB_VERSION_X1S: bytes.fromhex("20221120"),
@@ -38,11 +40,25 @@ def _sum8(payload: bytes) -> int:
     return sum(payload) & 0xFF
 
 
+# peer IP -> (monotonic time resolved, local source IP). Shared by the
+# transport's CALL_ME loop (every ~2 s while the hub is away), NOTIFY_ME
+# replies and the proxy's mDNS advertisement; the route rarely changes
+# that fast.
+_ROUTE_CACHE_TTL = 30.0
+_route_cache: Dict[str, Tuple[float, str]] = {}
+_route_cache_lock = threading.Lock()
+
+
 def _route_local_ip(peer_ip: str) -> str:
+    now = time.monotonic()
+    with _route_cache_lock:
+        cached = _route_cache.get(peer_ip)
+    if cached is not None and now - cached[0] < _ROUTE_CACHE_TTL:
+        return cached[1]
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect((peer_ip, 80))
-        return s.getsockname()[0]
+        local_ip = s.getsockname()[0]
     except Exception:
         return "127.0.0.1"
     finally:
@@ -50,6 +66,14 @@ def _route_local_ip(peer_ip: str) -> str:
             s.close()
         except Exception:
             pass
+    with _route_cache_lock:
+        _route_cache[peer_ip] = (now, local_ip)
+    return local_ip
+
+
+def _invalidate_route_cache(peer_ip: str) -> None:
+    with _route_cache_lock:
+        _route_cache.pop(peer_ip, None)
 
 
 def _broadcast_ip(peer_ip: str) -> str:
@@ -206,7 +230,7 @@ class NotifyDemuxer:
                 log.warning("[DEMUX] SO_REUSEPORT not available")
         s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
         s.bind(("0.0.0.0", self.listen_port))
-        s.settimeout(1.0)
+        s.setblocking(False)
         log.info(
             "[DEMUX] listening for NOTIFY_ME/CALL_ME on *:%d (SO_REUSEPORT=%s)",
             self.listen_port,
@@ -218,22 +242,40 @@ class NotifyDemuxer:
         sock = self._sock
         if sock is None:
             return
+        # One receive buffer for the life of the loop; datagrams are
+        # classified in place and only copied out when a handler keeps them.
+        buf = bytearray(2048)
+        view = memoryview(buf)
         while not self._stop_event.is_set():
             try:
-                pkt, (src_ip, src_port) = sock.recvfrom(2048)
-            except socket.timeout:
-                continue
-            except OSError:
+                readable, _, _ = select.select([sock], [], [], 1.0)
+            except (OSError, ValueError):
                 break
-
-            if pkt == NOTIFY_ME_PAYLOAD:
-                self._handle_notify_me(sock, pkt, src_ip, src_port)
+            if not readable:
                 continue
 
-            if len(pkt) >= 16 and pkt[0] == SYNC0 and pkt[1] == SYNC1:
-                op = (pkt[2] << 8) | pkt[3]
-                if op == OP_CALL_ME:
-                    self._handle_call_me(pkt, src_ip, src_port)
+            # Discovery retries arrive in bursts; drain what is queued so
+            # a burst costs one select() instead of one wakeup per packet.
+            for _ in range(_MAX_DATAGRAMS_PER_WAKE):
+                try:
+                    nbytes, (src_ip, src_port) = sock.recvfrom_into(buf)
+                except (BlockingIOError, InterruptedError):
+                    break
+                except OSError:
+                    return
+                self._handle_datagram(sock, view[:nbytes], src_ip, src_port)
+
+    def _handle_datagram(
+        self, sock: socket.socket, pkt: memoryview, src_ip: str, src_port: int
+    ) -> None:
+        if pkt == NOTIFY_ME_PAYLOAD:
+            self._handle_notify_me(sock, NOTIFY_ME_PAYLOAD, src_ip, src_port)
+            return
+
+        if len(pkt) >= 16 and pkt[0] == SYNC0 and pkt[1] == SYNC1:
+            op = (pkt[2] << 8) | pkt[3]
+            if op == OP_CALL_ME:
+                self._handle_call_me(bytes(pkt), src_ip, src_port)
 
     def _build_notify_reply(self, reg: NotifyRegistration) -> Optional[bytes]:
         name = (
@@ -325,11 +367,13 @@ class NotifyDemuxer:
                 get_hub_logger(log, reg.proxy_id).exception("[DEMUX] failed to send NOTIFY_ME reply")
 
     def _handle_call_me(self, pkt: bytes, src_ip: str, src_port: int) -> None:
+        if len(pkt) < 16:
+            return
         try:
             app_ip = socket.inet_ntoa(pkt[10:14])
-            app_port = struct.unpack(">H", pkt[14:16])[0]
         except Exception:
             return
+        app_port = int.from_bytes(pkt[14:16], "big")
 
         mac_hint = pkt[4:10]
         with self._lock:
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 """Opcode-specific frame handlers used by :class:`~.x1_proxy.X1Proxy`."""
 
+import logging
 import re
+import struct
 import time
 import unicodedata
 from typing import TYPE_CHECKING
@@ -16,7 +18,6 @@ from .macros import (
     parse_macro_records_from_burst,
 )
 from .protocol_const import (
-    BUTTONNAME_BY_CODE,
     ButtonName,
     FAMILY_DEVBTNS,
     FAMILY_FAV_ORDER_RESP,
@@ -85,6 +86,7 @@ from .protocol_const import (
     OP_X1_ACTIVITY,
     OP_X1_DEVICE,
     OP_KEYMAP_EXTRA,
+    button_name,
     classify_device_class_code,
     opcode_family,
 )
@@ -94,6 +96,45 @@ if TYPE_CHECKING:
 
 OP_CREATE_DEVICE_ACK = 0x0107
 
+_NON_PRINTABLE_ASCII = re.compile(r"[^\x20-\x7E]")
+_HTTP_METHOD_PATTERN = re.compile(r"\b(GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\b", re.IGNORECASE)
+
+# "[KEYMAP]" summary entry per button code, formatted once at import.
+_KEYMAP_LOG_LABELS: tuple[str, ...] = tuple(
+    f"{button_name(code) or f'0x{code:02X}'}(0x{code:02X})" for code in range(256)
+)
+
+# Catalog row head shared by device and activity rows on every hub line:
+# row index, two unused bytes, expected row count, two unused bytes, id (BE16).
+_CATALOG_ROW_HEAD = struct.Struct(">B2xB2xH")
+
+
+def _nul_terminated(buf: bytes, start: int, end: int | None = None) -> bytes:
+    """Return ``buf[start:end]`` cut at the first NUL byte.
+
+    Locates the terminator with ``bytes.find`` and slices once, rather than
+    ``split(b"\\x00", 1)`` copying both halves into a throwaway list.
+    """
+
+    stop = len(buf) if end is None else min(end, len(buf))
+    nul = buf.find(b"\x00", start, stop)
+    return buf[start : stop if nul < 0 else nul]
+
+
+def _catalog_row_head(payload: bytes) -> tuple[int | None, int | None, int | None]:
+    """Return ``(row_idx, expected_rows, row_id)`` from a catalog row payload.
+
+    Fields the payload is too short to carry come back as ``None``, and an
+    expected-row count of zero is reported as ``None`` (unknown).
+    """
+
+    if len(payload) >= _CATALOG_ROW_HEAD.size:
+        row_idx, expected_rows, row_id = _CATALOG_ROW_HEAD.unpack_from(payload)
+        return row_idx, expected_rows or None, row_id
+    row_idx = payload[0] if payload else None
+    expected_rows = payload[3] if len(payload) >= 4 and payload[3] > 0 else None
+    return row_idx, expected_rows, None
+
 
 def _consume_length_prefixed_string(buf: bytes, offset: int) -> tuple[str, int]:
     """Decode a length-prefixed UTF-8 string from ``buf`` starting at ``offset``."""
@@ -140,7 +181,7 @@ def _decode_utf16le_segment(payload: bytes, *, start: int = 0, length: int | Non
         return ""
     try:
         text = segment.decode("utf-16le", errors="ignore").replace("\x00", "")
-        text = re.sub(r"[^\x20-\x7E]", "", text)
+        text = _NON_PRINTABLE_ASCII.sub("", text)
         return text.strip()
     except Exception:
         return ""
@@ -302,7 +343,7 @@ def _parse_ip_command_fields(payload: bytes) -> tuple[str, str, dict[str, str]]:
 
     ascii_parts = _decode_ascii_blocks(payload)
     for part in ascii_parts:
-        clean = re.sub(r"[^\x20-\x7E]", "", part)
+        clean = _NON_PRINTABLE_ASCII.sub("", part)
         upper_clean = clean.upper()
 
         if not method:
@@ -333,7 +374,7 @@ def _parse_ip_command_fields(payload: bytes) -> tuple[str, str, dict[str, str]]:
             headers |= _parse_header_lines([clean])
 
     if method and not method.isalpha():
-        match = re.search(r"\b(GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\b", method, re.IGNORECASE)
+        match = _HTTP_METHOD_PATTERN.search(method)
         if match:
             method = match.group(1).upper()
 
@@ -618,7 +659,7 @@ class ActivateRequestHandler(BaseFrameHandler):
             name = ""
 
         cmd = proxy.state.commands.get(ent_id, {}).get(code)
-        btn = BUTTONNAME_BY_CODE.get(code) if cmd is None else None
+        btn = button_name(code) if cmd is None else None
         extra = f" cmd='{cmd}'" if cmd else (f" btn='{btn}'" if btn else "")
 
         proxy._log.info(
@@ -712,16 +753,14 @@ class CatalogDeviceHandler(BaseFrameHandler):
         now = time.monotonic()
 
         payload = frame.payload
-        raw = frame.raw
-        row_idx = payload[0] if len(payload) >= 1 else None
-        expected_rows = payload[3] if len(payload) >= 4 and payload[3] > 0 else None
-        dev_id = int.from_bytes(payload[6:8], "big") if len(payload) >= 8 else None
+        row_idx, expected_rows, dev_id = _catalog_row_head(payload)
         device_class_code = payload[10] if len(payload) > 10 else None
         device_class = classify_device_class_code(device_class_code)
-        name_bytes_raw = raw[36 : 36 + 60]
-        device_label = name_bytes_raw.decode("utf-16be").strip("\x00")
-        brand_bytes_raw = raw[96 : 96 + 60]
-        brand_label = brand_bytes_raw.decode("utf-16be", errors="ignore").strip("\x00")
+        # Decode the UTF-16BE name/brand slots straight out of the frame
+        # buffer; str() accepts a memoryview, so no slice copy is made.
+        with memoryview(frame.raw) as raw_view:
+            device_label = str(raw_view[36 : 36 + 60], "utf-16be").strip("\x00")
+            brand_label = str(raw_view[96 : 96 + 60], "utf-16be", "ignore").strip("\x00")
 
         # Keep the raw record body so the schema parser (parse_device_record)
         # can rebuild a faithful DeviceConfig on demand (e.g. for backup), with
@@ -770,17 +809,12 @@ class X1CatalogDeviceHandler(BaseFrameHandler):
         now = time.monotonic()
 
         payload = frame.payload
-        row_idx = payload[0] if payload else None
-        expected_rows = payload[3] if len(payload) >= 4 and payload[3] > 0 else None
-        dev_id = int.from_bytes(payload[6:8], "big") if len(payload) >= 8 else None
+        row_idx, expected_rows, dev_id = _catalog_row_head(payload)
         device_class_code = payload[10] if len(payload) > 10 else None
         device_class = classify_device_class_code(device_class_code)
 
-        name_bytes = payload[32:62]
-        device_label = name_bytes.split(b"\x00", 1)[0].decode("utf-8", errors="ignore")
-
-        brand_bytes = payload[62:]
-        brand_label = brand_bytes.split(b"\x00", 1)[0].decode("utf-8", errors="ignore")
+        device_label = _nul_terminated(payload, 32, 62).decode("utf-8", errors="ignore")
+        brand_label = _nul_terminated(payload, 62).decode("utf-8", errors="ignore")
 
         record_body = bytes(payload[3:]) if len(payload) > 3 else b""
 
@@ -871,18 +905,27 @@ def _decode_x1s_needs_confirm_flag(payload: bytes) -> bool:
     return flag_index < tail_end and payload[flag_index] == 0x01
 
 
-def _decode_x1s_activity_label(label_bytes: bytes) -> str:
+def _decode_x1s_activity_label(
+    label_bytes: bytes, start: int = 0, end: int | None = None
+) -> str:
     """Decode the activity name from the X1S/X2 row's fixed UTF-16BE slot.
 
-    ``label_bytes`` is the 60-byte slot from the row body (see schema comment
-    above). It is always UTF-16BE, null-padded to fill the slot; the first
-    null code unit terminates the visible label.
+    ``label_bytes[start:end]`` is the 60-byte slot from the row body (see
+    schema comment above); passing the whole frame with slot bounds avoids
+    copying the slot out first. It is always UTF-16BE, null-padded to fill
+    the slot; the first null code unit terminates the visible label.
     """
 
-    even_bytes = label_bytes[: len(label_bytes) & ~1]
-    text = even_bytes.decode("utf-16be", errors="ignore")
-    text = text.split("\x00", 1)[0]
-    text = text.strip()
+    # Cut at the first code-unit-aligned NUL before decoding so the padding
+    # tail never goes through the codec.
+    stop = len(label_bytes) if end is None else min(end, len(label_bytes))
+    stop = start + (max(stop - start, 0) & ~1)
+    nul = label_bytes.find(b"\x00\x00", start, stop)
+    while nul > start and (nul - start) & 1:
+        nul = label_bytes.find(b"\x00\x00", nul + 1, stop)
+    if nul >= 0:
+        stop = nul
+    text = label_bytes[start:stop].decode("utf-16be", errors="ignore").strip()
     while text and unicodedata.category(text[0]).startswith("C"):
         text = text[1:].lstrip()
     return text
@@ -897,13 +940,13 @@ class CatalogActivityHandler(BaseFrameHandler):
 
         payload = frame.payload
         raw = frame.raw
-        row_idx = payload[0] if len(payload) >= 1 else None
         # Start of a fresh activities list → reset 'active'
-        act_id = int.from_bytes(payload[6:8], "big") if len(payload) >= 8 else None
-        label_slot = raw[
-            ACTIVITY_ROW_LABEL_OFFSET : ACTIVITY_ROW_LABEL_OFFSET + ACTIVITY_ROW_LABEL_LEN
-        ]
-        activity_label = _decode_x1s_activity_label(label_slot)
+        row_idx, expected_rows, act_id = _catalog_row_head(payload)
+        activity_label = _decode_x1s_activity_label(
+            raw,
+            ACTIVITY_ROW_LABEL_OFFSET,
+            ACTIVITY_ROW_LABEL_OFFSET + ACTIVITY_ROW_LABEL_LEN,
+        )
         active_state_byte = raw[35] if len(raw) > 35 else 0
         is_active = active_state_byte == 0x01
         needs_confirm = _decode_x1s_needs_confirm_flag(payload)
@@ -911,7 +954,7 @@ class CatalogActivityHandler(BaseFrameHandler):
         if act_id is not None:
             accepted = proxy.ingest_activity_row(
                 row_idx=row_idx,
-                expected_rows=payload[3] if len(payload) >= 4 and payload[3] > 0 else None,
+                expected_rows=expected_rows,
                 act_id=act_id,
                 activity={
                     "id": act_id,
@@ -934,7 +977,7 @@ class CatalogActivityHandler(BaseFrameHandler):
             proxy._log.info(
                 "[ACT] #%d/%s name='%s' act_id=0x%04X (%d) state=%s",
                 row_idx,
-                payload[3] if len(payload) >= 4 and payload[3] > 0 else "?",
+                expected_rows if expected_rows is not None else "?",
                 activity_label,
                 act_id,
                 act_id,
@@ -963,24 +1006,17 @@ class X1CatalogActivityHandler(BaseFrameHandler):
         now = time.monotonic()
 
         payload = frame.payload
-        row_idx = payload[0] if payload else None
-
-        act_id = int.from_bytes(payload[6:8], "big") if len(payload) >= 8 else None
+        row_idx, expected_rows, act_id = _catalog_row_head(payload)
         active_flag = frame.raw[35] if len(frame.raw) > 35 else 0
         needs_confirm_flag = payload[95] if len(payload) > 95 else 0
-        activity_label = (
-            payload[32:]
-            .split(b"\x00", 1)[0]
-            .decode("utf-8", errors="ignore")
-            .strip()
-        )
+        activity_label = _nul_terminated(payload, 32).decode("utf-8", errors="ignore").strip()
         is_active = active_flag == 1
         needs_confirm = needs_confirm_flag == 1
 
         if act_id is not None:
             accepted = proxy.ingest_activity_row(
                 row_idx=row_idx,
-                expected_rows=payload[3] if len(payload) >= 4 and payload[3] > 0 else None,
+                expected_rows=expected_rows,
                 act_id=act_id,
                 activity={
                     "id": act_id,
@@ -1003,7 +1039,7 @@ class X1CatalogActivityHandler(BaseFrameHandler):
             proxy._log.info(
                 "[ACT] #%d/%s name='%s' act_id=0x%04X (%d) state=%s",
                 row_idx,
-                payload[3] if len(payload) >= 4 and payload[3] > 0 else "?",
+                expected_rows if expected_rows is not None else "?",
                 activity_label,
                 act_id,
                 act_id,
@@ -1190,18 +1226,16 @@ class KeymapHandler(BaseFrameHandler):
             )
             for act_lo, row_stream, row_count in completed:
                 proxy.state.replace_keymap_rows(act_lo, row_stream)
-                keys = [
-                    f"{BUTTONNAME_BY_CODE.get(c, f'0x{c:02X}')}(0x{c:02X})"
-                    for c in sorted(proxy.state.buttons.get(act_lo, set()))
-                ]
-                row_summary = f" rows={row_count}" if row_count is not None else ""
-                proxy._log.info(
-                    "[KEYMAP] act=0x%02X mapped{%d}%s: %s",
-                    act_lo,
-                    len(keys),
-                    row_summary,
-                    ", ".join(keys),
-                )
+                if proxy._log.isEnabledFor(logging.INFO):
+                    codes = sorted(proxy.state.buttons.get(act_lo, ()))
+                    row_summary = f" rows={row_count}" if row_count is not None else ""
+                    proxy._log.info(
+                        "[KEYMAP] act=0x%02X mapped{%d}%s: %s",
+                        act_lo,
+                        len(codes),
+                        row_summary,
+                        ", ".join([_KEYMAP_LOG_LABELS[c & 0xFF] for c in codes]),
+                    )
                 proxy._burst.finish(
                     f"buttons:{act_lo}",
                     can_issue=proxy.can_issue_commands,
@@ -1308,8 +1342,7 @@ class DeviceButtonSingleHandler(BaseFrameHandler):
             if len(payload) >= 76 and payload[8] == 0x1C:
                 label = payload[16:76].decode("utf-16le", errors="ignore").split("\x00", 1)[0].strip()
             else:
-                label_bytes = payload[15:45]
-                label = label_bytes.split(b"\x00", 1)[0].decode("ascii", errors="ignore").strip()
+                label = _nul_terminated(payload, 15, 45).decode("ascii", errors="ignore").strip()
             if label:
                 proxy.state.commands.setdefault(dev_id & 0xFF, {})[command_id & 0xFF] = label
             return
@@ -1406,11 +1439,7 @@ class DeviceButtonSingleHandler(BaseFrameHandler):
                     proxy.state.commands.setdefault(dev_key, {})[cmd_id] = label
 
                 if dev_key in proxy.state.commands:
-                    proxy._log.info(
-                        " ".join(
-                            f"{cmd_id:2d} : {label}" for cmd_id, label in proxy.state.commands[dev_key].items()
-                        )
-                    )
+                    _log_device_commands(proxy, proxy.state.commands[dev_key])
 
         if targeted_burst_key is not None:
             proxy._burst.finish(
@@ -1421,6 +1450,15 @@ class DeviceButtonSingleHandler(BaseFrameHandler):
             )
 
 
+def _log_device_commands(proxy: "X1Proxy", commands: dict[int, str]) -> None:
+    """Log a device's assembled command table, skipping the join below INFO."""
+
+    if proxy._log.isEnabledFor(logging.INFO):
+        proxy._log.info(
+            "%s", " ".join(f"{cmd_id:2d} : {label}" for cmd_id, label in commands.items())
+        )
+
+
 class DeviceButtonHeaderHandler(BaseFrameHandler):
     """Start device-command burst parsing."""
 
@@ -1455,9 +1493,7 @@ class DeviceButtonHeaderHandler(BaseFrameHandler):
                 dev_key = complete_dev_id & 0xFF
                 existing = proxy.state.commands.setdefault(dev_key, {})
                 existing.update(commands)
-                proxy._log.info(
-                    " ".join(f"{cmd_id:2d} : {label}" for cmd_id, label in existing.items())
-                )
+                _log_device_commands(proxy, existing)
 
         if completed:
             proxy._burst.finish(
@@ -1505,9 +1541,7 @@ class DeviceButtonPayloadHandler(BaseFrameHandler):
                 dev_key = complete_dev_id & 0xFF
                 existing = proxy.state.commands.setdefault(dev_key, {})
                 existing.update(commands)
-                proxy._log.info(
-                    " ".join(f"{cmd_id:2d} : {label}" for cmd_id, label in existing.items())
-                )
+                _log_device_commands(proxy, existing)
 
         if completed:
             proxy._burst.finish(
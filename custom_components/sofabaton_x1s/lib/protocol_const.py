@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 # Frame markers used by the hub protocol
 SYNC0, SYNC1 = 0xA5, 0x5A
@@ -65,6 +65,18 @@ BUTTONNAME_BY_CODE = {
     if isinstance(v, int) and k.isupper() and not k.startswith("_")
 }
 
+# Button codes are single bytes, so a dense 256-slot table answers name
+# lookups by index instead of a dict.get() call.
+_BUTTON_LABELS: Tuple[Optional[str], ...] = tuple(
+    BUTTONNAME_BY_CODE.get(code) for code in range(256)
+)
+
+
+def button_name(code: int) -> Optional[str]:
+    """Return the ``BUTTONNAME_BY_CODE`` label for a button code byte, if any."""
+
+    return _BUTTON_LABELS[code & 0xFF]
+
 
 # A→H requests (from client to hub)
 OP_REQ_BANNER = 0x0001  # yields family-0x02 banner reply with model/batch/hub-fw
@@ -320,6 +332,25 @@ OPNAMES: Dict[int, str] = {
 }
 
 
+# Private copy of OPNAMES that also accumulates ``OP_XXXX`` fallbacks, so
+# opcode_name() resolves known and unknown opcodes with a single lookup.
+_OPCODE_LABELS: Dict[int, str] = dict(OPNAMES)
+
+
+def opcode_name(opcode: int) -> str:
+    """Return the ``OPNAMES`` label for an opcode, or ``OP_XXXX`` if unnamed.
+
+    Fallback labels are formatted once per opcode and reused, so hot log
+    paths do not rebuild the same string for every frame. ``OPNAMES``
+    itself is left untouched.
+    """
+
+    name = _OPCODE_LABELS.get(opcode)
+    if name is None:
+        name = _OPCODE_LABELS[opcode] = f"OP_{opcode:04X}"
+    return name
+
+
 def opcode_hi(opcode: int) -> int:
     """Return the high byte of an opcode."""
 
@@ -335,7 +366,7 @@ def opcode_lo(opcode: int) -> int:
 def opcode_family(opcode: int) -> int:
     """Return the low-byte "family" for list/table opcodes."""
 
-    return opcode_lo(opcode)
+    return opcode & 0xFF
 
 
 # Known opcode families (low byte) grouped by semantic row/page type
@@ -515,7 +546,7 @@ def known_public_device_classes() -> tuple[str, ...]:
 def opcode_family_name(opcode: int) -> str | None:
     """Return a human-friendly name for an opcode family, if known."""
 
-    return FAMILY_NAMES.get(opcode_family(opcode))
+    return FAMILY_NAMES.get(opcode & 0xFF)
 
 
 def group_known_opcodes_by_family() -> dict[int, list[str]]:
@@ -537,6 +568,7 @@ __all__ = [
     "SYNC1",
     "ButtonName",
     "BUTTONNAME_BY_CODE",
+    "button_name",
     "DEVICE_CLASS_IR",
     "DEVICE_CLASS_BLUETOOTH",
     "DEVICE_CLASS_WIFI_HUE",
@@ -647,6 +679,7 @@ __all__ = [
     "OP_WIFI_FW",
     "OP_INFO_BANNER",
     "OPNAMES",
+    "opcode_name",
     "opcode_hi",
     "opcode_lo",
     "opcode_family",
@@ -27,7 +27,7 @@ from .protocol_const import (
     FAMILY_KEY_SORT_REQ,
     OP_REQ_ACTIVITY_INPUTS,
     OP_STATUS_ACK,
-    OPNAMES,
+    opcode_name,
 )
 
 
@@ -64,7 +64,7 @@ class AckWaitersMixin:
             return self._pending_assigned_device_id
 
     def notify_ack(self, opcode: int, payload: bytes) -> None:
-        name = OPNAMES.get(opcode, f"OP_{opcode:04X}")
+        name = opcode_name(opcode)
         if opcode == OP_STATUS_ACK:
             status = payload[0] if payload else None
             if status == 0x00:
@@ -25,6 +25,7 @@ from .hub_versions import (
 )
 from .hub_logging import LogTag
 from .macros import MacroRecord
+from .proxy_exchange import _requires_idle_proxy
 from .device_create import (
     FAMILY_REMOTE_SYNC,
     build_button_binding_step,
@@ -60,6 +61,11 @@ _ACTIVITY_ROW_TAIL_LEN = 60
 _ACTIVITY_ROW_NAME_OFFSET = 32
 _ACTIVITY_ROW_NAME_ASCII_LEN = 60
 
+# Family-0x3E favorite-map payload: fixed header, then activity/slot/device,
+# the 0x4E2X command code, the command id and a trailing checksum token.
+_FAVORITE_MAP_HEADER = b"\x01\x00\x01\x01\x00\x01"
+_FAVORITE_MAP_PAYLOAD_LEN = 25
+
 
 
 class ActivityOpsMixin:
@@ -708,42 +714,27 @@ class ActivityOpsMixin:
         command_id: int,
         slot_id: int,
     ) -> bytes:
-        payload = bytearray(
-            [
-                0x01,
-                0x00,
-                0x01,
-                0x01,
-                0x00,
-                0x01,
-                activity_id & 0xFF,
-                slot_id & 0xFF,
-                device_id & 0xFF,
-                0x00,
-                0x00,
-                0x00,
-                0x00,
-            ]
-        )
-        cmd_lo = command_id & 0xFF
+        """Build the family-0x3E favorite-map payload.
+
+        Every id must already be masked to a single byte; the caller
+        (:meth:`command_to_favorite`) does that once up front.
+        """
+
+        # Fixed 25-byte layout, written in place into one zero-filled buffer:
+        #   [01 00 01 01 00 01] act slot dev [00 00 00 00] 4E code cmd
+        #   [00 x8] token
+        payload = bytearray(_FAVORITE_MAP_PAYLOAD_LEN)
+        payload[0:6] = _FAVORITE_MAP_HEADER
+        payload[6] = activity_id
+        payload[7] = slot_id
+        payload[8] = device_id
+        payload[13] = 0x4E
         if self.hub_version in (HUB_VERSION_X1S, HUB_VERSION_X2):
-            payload.extend([0x4E, 0x20 + cmd_lo])
+            payload[14] = 0x20 + command_id
         else:
-            payload.extend((0x4E24).to_bytes(2, "big"))
-        payload.extend(
-            [
-                cmd_lo,
-                0x00,
-                0x00,
-                0x00,
-                0x00,
-                0x00,
-                0x00,
-                0x00,
-                0x00,
-            ]
-        )
-        payload.append((sum(payload) - 2) & 0xFF)
+            payload[14] = 0x24
+        payload[15] = command_id
+        payload[-1] = (sum(payload) - 2) & 0xFF
         return bytes(payload)
 
     def _build_favorite_stage_payload(self, activity_id: int, fav_count: int = 4) -> bytes:
@@ -1048,6 +1039,7 @@ class ActivityOpsMixin:
             "status": "success",
         }
 
+    @_requires_idle_proxy("FAVORITE", "command_to_favorite")
     def command_to_favorite(
         self,
         activity_id: int,
@@ -1060,10 +1052,6 @@ class ActivityOpsMixin:
     ) -> dict[str, Any] | None:
         """Add a command favorite to an arbitrary activity."""
 
-        if not self.can_issue_commands():
-            self._log.info("[FAVORITE] command_to_favorite ignored: proxy client is connected")
-            return None
-
         act_lo = activity_id & 0xFF
         dev_lo = device_id & 0xFF
         cmd_lo = command_id & 0xFF
@@ -1188,6 +1176,7 @@ class ActivityOpsMixin:
             "status": "success",
         }
 
+    @_requires_idle_proxy("KEYMAP_WRITE", "command_to_button")
     def command_to_button(
         self,
         activity_id: int,
@@ -1206,10 +1195,6 @@ class ActivityOpsMixin:
         same physical button.
         """
 
-        if not self.can_issue_commands():
-            self._log.info("[KEYMAP_WRITE] command_to_button ignored: proxy client is connected")
-            return None
-
         act_lo = activity_id & 0xFF
         btn_lo = button_id & 0xFF
         dev_lo = device_id & 0xFF
@@ -114,27 +114,29 @@ class CatalogMixin:
         return ok
 
     def get_activities(self, *, force_refresh: bool = True) -> tuple[dict[int, dict], bool]:
-        to_export_view = _to_export_view()
         if force_refresh:
             if self.can_issue_commands():
                 self.request_activities()
             return ({}, False)
 
-        activities_view = self.state.entities("activity")
         if self._activities_catalog_ready:
+            # Callers keep the returned entries (the hub stores them as its
+            # own snapshot), so each one is a fresh raw_body-free copy.
+            to_export_view = _to_export_view()
+            activities_view = self.state.entities("activity")
             return ({k: to_export_view(v) for k, v in activities_view.items()}, True)
 
         return ({}, False)
 
     def get_devices(self, *, force_refresh: bool = False) -> tuple[dict[int, dict], bool]:
-        to_export_view = _to_export_view()
         if force_refresh:
             if self.can_issue_commands():
                 self.enqueue_cmd(OP_REQ_DEVICES, expects_burst=True, burst_kind="devices")
             return ({}, False)
 
-        devices_view = self.state.entities("device")
         if self._devices_catalog_ready:
+            to_export_view = _to_export_view()
+            devices_view = self.state.entities("device")
             return ({k: to_export_view(v) for k, v in devices_view.items()}, True)
 
         if self.can_issue_commands():
@@ -25,6 +25,7 @@ enforces that no raw send exists outside these paths.
 from __future__ import annotations
 
 import contextlib
+import functools
 import threading
 import time
 
@@ -33,6 +34,27 @@ from .device_create import ACK_OPCODE_STATUS, ACK_STATUS_BYTE_OK
 from .hub_logging import LogTag
 
 
+def _requires_idle_proxy(tag: str, name: str):
+    """Gate a proxy write method on :meth:`can_issue_commands`.
+
+    When the hub is not connected or the official app owns the session,
+    the wrapped method logs ``[<tag>] <name> ignored`` and returns
+    ``None`` without running.
+    """
+
+    def _decorator(fn):
+        @functools.wraps(fn)
+        def _wrapper(self, *args, **kwargs):
+            if not self.can_issue_commands():
+                self._log.info("[%s] %s ignored: proxy client is connected", tag, name)
+                return None
+            return fn(self, *args, **kwargs)
+
+        return _wrapper
+
+    return _decorator
+
+
 class ExchangeMixin:
     """Mixin providing the exchange guard and the one-step executor."""
 
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List, Tuple
+from typing import Dict, List
 
+from .deframer import DeframedFrame
 from .frame_handlers import FrameContext, frame_handler_registry
 from .commands import (
     parse_button_burst_frame,
@@ -13,17 +14,18 @@ from .commands import (
 from .macros import parse_macro_burst_frame
 from .hub_logging import LogTag
 from .protocol_const import (
+    FAMILY_NAMES,
     FAMILY_PLAY_BLOB,
     OP_CATALOG_ROW_DEVICE,
     OP_REQ_ACTIVITIES,
     OP_REQ_DEVICES,
     OPNAMES,
     opcode_family,
-    opcode_family_name,
 )
 
 
 def _hexdump(data: bytes) -> str:
+    # bytes.hex() formats in one C pass; callers gate on DEBUG first.
     return data.hex(" ")
 
 
@@ -31,7 +33,7 @@ class FrameDecodeMixin:
     """Mixin providing deframer feed hooks and structured frame logs."""
 
     def _handle_hub_frame(self, data: bytes, cid: int) -> None:
-        if self.diag_dump:
+        if self.diag_dump and self._log.isEnabledFor(logging.DEBUG):
             self._log.debug("%s #%d H→A %s", LogTag.WIRE, cid, _hexdump(data))
         frames = self._df_h2a.feed(data, cid)
         if frames:
@@ -40,7 +42,7 @@ class FrameDecodeMixin:
                 self._log_frames("H→A", frames)
 
     def _handle_app_frame(self, data: bytes, cid: int) -> None:
-        if self.diag_dump:
+        if self.diag_dump and self._log.isEnabledFor(logging.DEBUG):
             self._log.debug("%s #%d A→H %s", LogTag.WIRE, cid, _hexdump(data))
         frames = self._df_a2h.feed(data, cid)
         if frames:
@@ -48,7 +50,7 @@ class FrameDecodeMixin:
             if self.diag_parse:
                 self._log_frames("A→H", frames)
 
-    def _handle_app_frames(self, frames: List[Tuple[int, bytes, bytes, int, int]]) -> None:
+    def _handle_app_frames(self, frames: List[DeframedFrame]) -> None:
         for opcode, _raw, _payload, _scid, _ecid in frames:
             if opcode == OP_REQ_DEVICES:
                 self._begin_device_request()
@@ -64,10 +66,12 @@ class FrameDecodeMixin:
                 # running-activity state stays current while connected.
                 self._begin_activity_request()
 
-    def _handle_hub_frames(self, frames: List[Tuple[int, bytes, bytes, int, int]]) -> None:
-        for opcode, _raw, _payload, _scid, _ecid in frames:
-            if opcode == OP_CATALOG_ROW_DEVICE:
+    def _handle_hub_frames(self, frames: List[DeframedFrame]) -> None:
+        # Clearing the retry is idempotent, so the first device row is enough.
+        for frame in frames:
+            if frame[0] == OP_CATALOG_ROW_DEVICE:
                 self._clear_app_device_retry()
+                break
 
     def _clear_app_device_retry(self) -> None:
         self._app_devices_deadline = None
@@ -85,7 +89,7 @@ class FrameDecodeMixin:
 
         return time.monotonic()
 
-    def _log_frames(self, direction: str, frames: List[Tuple[int, bytes, bytes, int, int]]) -> None:
+    def _log_frames(self, direction: str, frames: List[DeframedFrame]) -> None:
         # This method has two responsibilities, only one of which is logging:
         #   1. dispatch each frame to its registered frame_handler_registry
         #      handler — that is the path that ingests activities/devices/
@@ -95,14 +99,16 @@ class FrameDecodeMixin:
         # The DEBUG-only work is skipped when nothing is listening, but the
         # handler dispatch must run regardless of log level — gating it would
         # leave the catalog empty whenever hex logging is off.
+        log_debug = self._log.debug
         debug_enabled = self._log.isEnabledFor(logging.DEBUG)
+        handler_table = frame_handler_registry.table_for(direction)
         for op, raw, payload, scid, ecid in frames:
             name: str | None = None
 
             if debug_enabled:
                 name = OPNAMES.get(op)
-                fam_name = opcode_family_name(op)
                 fam = opcode_family(op)
+                fam_name = FAMILY_NAMES.get(fam)
                 note = f"chunk={scid}→{ecid}" if scid != ecid else f"chunk={ecid}"
                 parsed = parse_command_burst_frame(
                     op,
@@ -123,7 +129,7 @@ class FrameDecodeMixin:
                     label = f"family={fam_name} op=0x{op:04X}"
                 else:
                     label = f"unknown op=0x{op:04X}"
-                self._log.debug(
+                log_debug(
                     "%s %s %s len=%d %s", LogTag.FRAME, direction, label, len(raw), note
                 )
                 if parsed is not None:
@@ -147,7 +153,7 @@ class FrameDecodeMixin:
                         if parsed.total_commands is not None
                         else ""
                     )
-                    self._log.debug(
+                    log_debug(
                         f"{LogTag.FRAME} %s REQ_COMMANDS role=%s variant=%s page=%s dev=0x%02X%s%s%s",
                         note,
                         parsed.role,
@@ -176,7 +182,7 @@ class FrameDecodeMixin:
                         else ""
                     )
                     row_data = " row_data=yes" if parsed_buttons.has_row_data else " row_data=no"
-                    self._log.debug(
+                    log_debug(
                         f"{LogTag.FRAME} %s REQ_BUTTONS role=%s variant=%s page=%s%s%s%s",
                         note,
                         parsed_buttons.role,
@@ -204,7 +210,7 @@ class FrameDecodeMixin:
                         else ""
                     )
                     len_ok = " len_ok=yes" if parsed_macro.payload_length_matches_hi else " len_ok=no"
-                    self._log.debug(
+                    log_debug(
                         f"{LogTag.FRAME} %s REQ_MACROS role=%s frag=%s%s%s%s",
                         note,
                         parsed_macro.role,
@@ -219,7 +225,11 @@ class FrameDecodeMixin:
                     if blob is not None:
                         descriptor_text = self._descriptive_play_blob_text(blob)
                         if descriptor_text is not None:
-                            self._log.debug("%s descriptor %s", LogTag.IR, descriptor_text)
+                            log_debug("%s descriptor %s", LogTag.IR, descriptor_text)
+
+            handlers = handler_table[op]
+            if not handlers:
+                continue
 
             context = FrameContext(
                 proxy=self,
@@ -229,9 +239,8 @@ class FrameDecodeMixin:
                 raw=raw,
                 name=name,
             )
-
-            for handler in frame_handler_registry.iter_for(op, direction):
+            for handler in handlers:
                 try:
                     handler.handle(context)
                 except Exception:
-                    self._log.debug("%s error while decoding op 0x%04X via %s", LogTag.PARSE, op, handler.__class__.__name__, exc_info=True)
+                    log_debug("%s error while decoding op 0x%04X via %s", LogTag.PARSE, op, handler.__class__.__name__, exc_info=True)
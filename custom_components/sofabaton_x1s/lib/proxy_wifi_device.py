@@ -33,6 +33,7 @@ from .device_create import DeviceCreateRequest, DeviceCreateResult, run_device_c
 from .devices import DeviceConfig, build_device_create_payload
 from .inputs import InputEntry, build_inputs_write
 from .macros import MacroKeyEntry, build_macro_save_payload
+from .proxy_exchange import _requires_idle_proxy
 from .protocol_const import (
     ButtonName,
     DEVICE_CLASS_WIFI_IP,
@@ -70,6 +71,20 @@ def _validate_wifi_input_ids(
     return normalized
 
 
+def _utf16le_field(text: str, width: int, *, lead: int = 0) -> bytes:
+    """Encode ``text`` as UTF-16LE into a zero-filled ``width``-byte field.
+
+    ``lead`` zero bytes precede the text (the X1S/X2 name fields carry a
+    one-byte prefix); anything past ``width`` is truncated.
+    """
+
+    field = bytearray(width)
+    raw = text.encode("utf-16le")
+    n = min(len(raw), width - lead)
+    field[lead : lead + n] = raw[:n]
+    return bytes(field)
+
+
 def _wifi_command_label(command_spec: Any, idx: int) -> str:
     if isinstance(command_spec, dict):
         return (
@@ -312,8 +327,8 @@ class WifiDeviceMixin:
         payload[7] = device_id & 0xFF
         payload[9] = device_id & 0xFF
         payload.extend(b"\x4d\x00")
-        payload.extend(b"\x00" + device_name.encode("utf-16le")[:59].ljust(59, b"\x00"))
-        payload.extend(b"\x00" + brand_name.encode("utf-16le")[:59].ljust(59, b"\x00"))
+        payload.extend(_utf16le_field(device_name, 60, lead=1))
+        payload.extend(_utf16le_field(brand_name, 60, lead=1))
         payload.extend(_ROKU_X1S_INPUT_FINALIZE_TAIL)
         payload[-1] = (sum(payload[:-1]) - 0x02) & 0xFF
         return bytes(payload)
@@ -614,6 +629,7 @@ class WifiDeviceMixin:
 
         return True
 
+    @_requires_idle_proxy("WIFI", "create_wifi_device")
     def create_wifi_device(
         self,
         device_name: str = "Home Assistant",
@@ -631,9 +647,6 @@ class WifiDeviceMixin:
         callers.
         """
 
-        if not self.can_issue_commands():
-            self._log.info("[WIFI] create_wifi_device ignored: proxy client is connected")
-            return None
         normalized_commands = list(commands or [])
         request = DeviceCreateRequest(
             transport="network_callback",
@@ -756,9 +769,7 @@ class WifiDeviceMixin:
 
         for slot, code, name, action in command_defs:
             if self.hub_version in (HUB_VERSION_X1S, HUB_VERSION_X2):
-                name_utf16 = name.encode("utf-16le")[:59]
-                name_blob = b"\x00" + name_utf16
-                name_blob = name_blob.ljust(60, b"\x00")
+                name_blob = _utf16le_field(name, 60, lead=1)
             else:
                 name_blob = name.encode("ascii", errors="ignore")[:30].ljust(30, b"\x00")
             # Cap the path at 255 bytes so render_wifi_roku_blob_body's
@@ -928,6 +939,7 @@ class WifiDeviceMixin:
             return None
 
         request_ip = ipaddress.IPv4Address(ip_address).packed
+        request_port_bytes = (request_port & 0xFFFF).to_bytes(2, "big")
         for idx, command_spec in enumerate((commands or [])[: len(_ROKU_APP_SLOTS)]):
             slot = (idx + 1) & 0xFF
             if isinstance(command_spec, dict):
@@ -944,7 +956,7 @@ class WifiDeviceMixin:
                 press_type = "short"
             # Observed X1S/X2 0x?E0E payloads encode command labels in a 59-byte field.
             # Using 59 keeps downstream request bytes aligned so method parses as POST (not xPOST).
-            command_utf16 = command_name.encode("utf-16le")[:59].ljust(59, b"\x00")
+            command_utf16 = _utf16le_field(command_name, 59)
             command_index = int(command_spec.get("command_index", idx)) if isinstance(command_spec, dict) else idx
             request_blob = self._build_virtual_ip_http_request(
                 host=ip_address,
@@ -960,7 +972,7 @@ class WifiDeviceMixin:
                 + (b"\x00" * 7)
                 + command_utf16
                 + request_ip
-                + int(request_port & 0xFFFF).to_bytes(2, "big")
+                + request_port_bytes
                 + b"\x00"
                 + bytes([len(request_blob) & 0xFF])
                 + request_blob
@@ -541,7 +541,9 @@ class ActivityCache:
                     "button_code": int.from_bytes(record.control[1:7], "big"),
                     "sort_id": record.sort_id & 0xFF,
                 }
-            if record.command_id not in commands_found and record.label:
+            # Keep the first labelled record per command id; the label test
+            # is cheaper than the dict probe, so it goes first.
+            if record.label and record.command_id not in commands_found:
                 commands_found[record.command_id] = record.label
         return commands_found
 
@@ -616,6 +618,9 @@ class ActivityCache:
         return list(self.app_activations)
 
 
+_RESOLVED_LISTENER_CACHE_MAX = 256
+
+
 class BurstScheduler:
     # ``response_grace`` is the fallback window the scheduler waits — for the
     # first frame, between frames, and after the last frame — before it treats
@@ -634,11 +639,15 @@ class BurstScheduler:
         self.active = False
         self.kind: str | None = None
         self.last_ts = 0.0
-        self.queue: list[tuple[int, bytes, bool, Optional[str]]] = []
+        self.queue: Deque[tuple[int, bytes, bool, Optional[str]]] = deque()
         self.listeners: dict[str, list[Callable[[str], None]]] = {}
+        # Exact + prefix subscribers per burst key, resolved on first use and
+        # dropped whenever a listener is registered.
+        self._resolved_listeners: dict[str, tuple[Callable[[str], None], ...]] = {}
 
     def on_burst_end(self, key: str, cb: Callable[[str], None]) -> None:
         self.listeners.setdefault(key, []).append(cb)
+        self._resolved_listeners.clear()
 
     def start(self, kind: str, *, now: Optional[float] = None) -> None:
         self.active = True
@@ -723,7 +732,7 @@ class BurstScheduler:
         self._notify_burst_end(finished_kind)
 
         while self.queue:
-            op, payload, is_burst, next_kind = self.queue.pop(0)
+            op, payload, is_burst, next_kind = self.queue.popleft()
             if not can_issue():
                 continue
             if is_burst:
@@ -733,10 +742,16 @@ class BurstScheduler:
                 break
 
     def _notify_burst_end(self, key: str) -> None:
-        for cb in self.listeners.get(key, []):
+        callbacks = self._resolved_listeners.get(key)
+        if callbacks is None:
+            callbacks = tuple(self.listeners.get(key, ()))
+            if ":" in key:
+                callbacks += tuple(self.listeners.get(key.split(":", 1)[0], ()))
+            # Keys such as "commands:<dev>:<cmd>" are open-ended; keep the
+            # memo from growing without bound across long sessions.
+            if len(self._resolved_listeners) >= _RESOLVED_LISTENER_CACHE_MAX:
+                self._resolved_listeners.clear()
+            self._resolved_listeners[key] = callbacks
+        for cb in callbacks:
             cb(key)
-        if ":" in key:
-            prefix = key.split(":", 1)[0]
-            for cb in self.listeners.get(prefix, []):
-                cb(key)
 
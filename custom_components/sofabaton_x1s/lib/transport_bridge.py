@@ -8,8 +8,10 @@ import socket
 import struct
 import threading
 import time
+from collections import deque
 from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
+from .deframer import _find_sync
 from .hub_logging import HubLogger, LogTag, get_hub_logger
 from .hub_listener import get_hub_listener
 from .protocol_const import OP_CALL_ME, SYNC0, SYNC1
@@ -18,6 +20,8 @@ from .notify_demuxer import (
     build_connect_ready_beacon,
     get_notify_demuxer,
     _broadcast_ip,
+    _invalidate_route_cache,
+    _route_local_ip,
 )
 
 log = logging.getLogger("x1proxy.transport")
@@ -27,18 +31,9 @@ def _sum8(b: bytes) -> int:
     return sum(b) & 0xFF
 
 
-def _route_local_ip(peer_ip: str) -> str:
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect((peer_ip, 80))
-        return s.getsockname()[0]
-    except Exception:
-        return "127.0.0.1"
-    finally:
-        try:
-            s.close()
-        except Exception:
-            pass
+# Upper bound on how long the CALL_ME loop sleeps on a connected hub before
+# re-checking the socket directly.
+_HUB_DOWN_RECHECK_S = 5.0
 
 
 def _enable_keepalive(
@@ -89,14 +84,13 @@ def _flush_buffer(
 
     while buf:
         try:
-            # Send from a snapshot copy, never the shared bytearray
-            # itself: socket.send(bytearray) holds a buffer-protocol
-            # export for the duration of the syscall, and a concurrent
-            # send_local() extend() on another thread then dies with
-            # "BufferError: Existing exports of data: object cannot be
-            # re-sized" (live-hub bench, 2026-07-12). The copy is a few
-            # hundred bytes at most; del buf[:sent] below interleaves
-            # GIL-atomically with a concurrent extend.
+            # Send from a snapshot copy, never the bytearray itself:
+            # socket.send(bytearray) holds a buffer-protocol export for
+            # the duration of the syscall, and resizing the buffer while
+            # it is exported dies with "BufferError: Existing exports of
+            # data: object cannot be re-sized" (live-hub bench,
+            # 2026-07-12, when send_local() still extended the buffer
+            # being flushed). The copy is a few hundred bytes at most.
             sent = sock.send(bytes(buf))
         except (BlockingIOError, InterruptedError):
             break
@@ -156,6 +150,12 @@ class TransportBridge:
         self._hub_lock = threading.Lock()
         self._app_lock = threading.Lock()
         self._wake_lock = threading.Lock()
+        # Set while no hub socket is installed; lets the CALL_ME loop sleep
+        # through a connected session instead of polling it. Only ever
+        # flipped under _hub_lock together with the _hub_sock assignment,
+        # so it cannot disagree with the socket after a drop/reconnect race.
+        self._hub_down = threading.Event()
+        self._hub_down.set()
 
         self._call_me_thr: Optional[threading.Thread] = None
         self._bridge_thr: Optional[threading.Thread] = None
@@ -163,9 +163,14 @@ class TransportBridge:
         self._listener_registered = False
         self._discovery_enabled = False
 
-        self._local_to_hub = bytearray()
+        # Frames queued by send_local(). Producers only append and the
+        # bridge thread only popleft()s, both GIL-atomic, so neither side
+        # ever resizes a buffer the other one is reading.
+        self._local_to_hub: deque[bytes] = deque()
         self._wake_reader: Optional[socket.socket] = None
         self._wake_writer: Optional[socket.socket] = None
+        # True while a wake byte is queued and the bridge has not drained it.
+        self._wake_pending = False
 
         # callbacks
         self._hub_frame_cbs: list[Callable[[bytes, int], None]] = []
@@ -240,6 +245,7 @@ class TransportBridge:
         with self._hub_lock:
             existing = self._hub_sock
             self._hub_sock = None
+            self._hub_down.set()
         if existing is not None:
             try:
                 existing.shutdown(socket.SHUT_RDWR)
@@ -275,7 +281,7 @@ class TransportBridge:
         return self.is_hub_connected and not self.is_client_connected
 
     def send_local(self, payload: bytes) -> None:
-        self._local_to_hub.extend(payload)
+        self._local_to_hub.append(bytes(payload))
         self._signal_wake()
 
     # ------------------------------------------------------------------
@@ -311,7 +317,9 @@ class TransportBridge:
 
     def stop(self) -> None:
         self._stop.set()
+        self._hub_down.set()
         self._signal_wake()
+        _invalidate_route_cache(self.real_hub_ip)
         self._stop_notify_listener()
         if self._listener_registered:
             try:
@@ -331,6 +339,7 @@ class TransportBridge:
                 except Exception:
                     pass
                 self._hub_sock = None
+                self._hub_down.set()
                 self._notify_hub_state(False)
 
         with self._app_lock:
@@ -437,34 +446,44 @@ class TransportBridge:
         """
 
         udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        frame_key: Optional[Tuple[str, int]] = None
+        frame = b""
         try:
             last = 0.0
             while not self._stop.is_set():
                 if self.is_hub_connected:
-                    time.sleep(0.3)
+                    if self._hub_down.is_set():
+                        # Socket swapped in without clearing the event;
+                        # poll at the old rate rather than spin on wait().
+                        self._stop.wait(0.3)
+                    else:
+                        # Woken by a hub drop or stop().
+                        self._hub_down.wait(_HUB_DOWN_RECHECK_S)
                     continue
                 if self._ota_pause_active():
-                    time.sleep(0.5)
+                    self._stop.wait(0.5)
                     continue
                 now = time.time()
                 if now - last >= 2.0 + random.uniform(-0.25, 0.25):
                     try:
                         my_ip = _route_local_ip(self.real_hub_ip)
-                        payload = (
-                            b"\x00" * 6
-                            + socket.inet_aton(my_ip)
-                            + struct.pack(">H", self.hub_listen_base)
-                        )
-                        frame = (
-                            bytes([SYNC0, SYNC1, (OP_CALL_ME >> 8) & 0xFF, OP_CALL_ME & 0xFF])
-                            + payload
-                        )
-                        frame += bytes([_sum8(frame)])
+                        if frame_key != (my_ip, self.hub_listen_base):
+                            payload = (
+                                b"\x00" * 6
+                                + socket.inet_aton(my_ip)
+                                + struct.pack(">H", self.hub_listen_base)
+                            )
+                            frame = (
+                                bytes([SYNC0, SYNC1, (OP_CALL_ME >> 8) & 0xFF, OP_CALL_ME & 0xFF])
+                                + payload
+                            )
+                            frame += bytes([_sum8(frame)])
+                            frame_key = (my_ip, self.hub_listen_base)
                         udp.sendto(frame, (self.real_hub_ip, self.real_hub_udp_port))
                     except OSError:
                         self._log.debug("%s CALL_ME send failed", LogTag.TRANSPORT, exc_info=True)
                     last = now
-                time.sleep(0.2)
+                self._stop.wait(0.2)
         finally:
             try:
                 udp.close()
@@ -515,6 +534,7 @@ class TransportBridge:
         with self._hub_lock:
             existing = self._hub_sock
             self._hub_sock = hub_sock
+            self._hub_down.clear()
         if existing is not None:
             self._log.warning(
                 "%s replacing existing hub socket on new connection from %s:%d",
@@ -576,14 +596,19 @@ class TransportBridge:
         app_to_hub = bytearray()
         hub_to_app = bytearray()
         app_partial_frame = bytearray()
+        local_to_hub = self._local_to_hub
+        local_pending = bytearray()
 
         while not self._stop.is_set():
-            with self._hub_lock:
-                hub = self._hub_sock
-            with self._app_lock:
-                app = self._app_sock
-            with self._wake_lock:
-                wake_reader = self._wake_reader
+            while local_to_hub:
+                local_pending += local_to_hub.popleft()
+
+            # Single attribute reads are atomic; the locks only serialise the
+            # rare swaps on connect/disconnect, and a socket closed between
+            # this snapshot and select() is handled like any other failure.
+            hub = self._hub_sock
+            app = self._app_sock
+            wake_reader = self._wake_reader
 
             rlist: List[socket.socket] = []
             if hub is not None:
@@ -594,7 +619,7 @@ class TransportBridge:
                 rlist.append(wake_reader)
 
             wlist: List[socket.socket] = []
-            if hub is not None and (app_to_hub or self._local_to_hub):
+            if hub is not None and (app_to_hub or local_pending):
                 wlist.append(hub)
             if app is not None and hub_to_app:
                 wlist.append(app)
@@ -636,6 +661,7 @@ class TransportBridge:
                         except Exception:
                             pass
                         self._hub_sock = None
+                        self._hub_down.set()
                     self._notify_hub_state(False)
                     app_to_hub.clear()
                 else:
@@ -691,7 +717,7 @@ class TransportBridge:
                         if len(buffer) < 2:
                             break
                         if buffer[0] != SYNC0 or buffer[1] != SYNC1:
-                            idx = buffer.find(bytes([SYNC0, SYNC1]))
+                            idx = _find_sync(buffer)
                             if idx < 0:
                                 # Keep a trailing lone SYNC0 across reads.
                                 if buffer and buffer[-1] == SYNC0:
@@ -711,9 +737,10 @@ class TransportBridge:
                         frame_len = 5 + buffer[2]
                         if len(buffer) < frame_len:
                             break
-                        cand = bytes(buffer[:frame_len])
-                        if cand[-1] == (_sum8(cand[:-1]) & 0xFF):
-                            frames_to_send.append(cand)
+                        with memoryview(buffer) as mv:
+                            ok = buffer[frame_len - 1] == _sum8(mv[: frame_len - 1])
+                        if ok:
+                            frames_to_send.append(bytes(buffer[:frame_len]))
                             del buffer[:frame_len]
                             continue
                         # Bad checksum at this sync — drop one byte and
@@ -742,6 +769,7 @@ class TransportBridge:
                                     except Exception:
                                         pass
                                     self._hub_sock = None
+                                    self._hub_down.set()
                                 self._notify_hub_state(False)
                                 break
                             if (
@@ -751,8 +779,8 @@ class TransportBridge:
                                 time.sleep(self._inter_command_gap)
 
             if hub is not None and hub in w:
-                if self._local_to_hub:
-                    if _flush_buffer(hub, self._local_to_hub, "local", self._log):
+                if local_pending:
+                    if _flush_buffer(hub, local_pending, "local", self._log):
                         with self._hub_lock:
                             try:
                                 hub.shutdown(socket.SHUT_RDWR)
@@ -763,6 +791,7 @@ class TransportBridge:
                             except Exception:
                                 pass
                             self._hub_sock = None
+                            self._hub_down.set()
                         self._notify_hub_state(False)
                         app_to_hub.clear()
                         continue
@@ -778,6 +807,7 @@ class TransportBridge:
                             except Exception:
                                 pass
                             self._hub_sock = None
+                            self._hub_down.set()
                         self._notify_hub_state(False)
                         app_to_hub.clear()
 
@@ -798,13 +828,14 @@ class TransportBridge:
                         app_partial_frame.clear()
                         self._notify_client_state(False)
 
-            for cb in self._idle_cbs:
-                cb(time.monotonic())
+            if self._idle_cbs:
+                now = time.monotonic()
+                for cb in self._idle_cbs:
+                    cb(now)
 
-            if self._local_to_hub:
-                with self._hub_lock:
-                    if self._hub_sock is None:
-                        self._local_to_hub.clear()
+            if (local_pending or local_to_hub) and self._hub_sock is None:
+                local_pending.clear()
+                local_to_hub.clear()
 
         self._close_wake_channel()
 
@@ -816,29 +847,41 @@ class TransportBridge:
         with self._wake_lock:
             self._wake_reader = wake_reader
             self._wake_writer = wake_writer
+            self._wake_pending = False
 
     def _signal_wake(self) -> None:
+        # One queued byte is enough to break the bridge out of select();
+        # further signals before it drains would only cost extra syscalls.
+        if self._wake_pending:
+            return
         with self._wake_lock:
             wake_writer = self._wake_writer
         if wake_writer is None:
             return
+        self._wake_pending = True
         try:
             wake_writer.send(b"\x00")
         except (BlockingIOError, InterruptedError):
             pass
         except OSError:
-            pass
+            self._wake_pending = False
 
     def _drain_wake_socket(self, wake_reader: socket.socket) -> None:
+        # Clear only once the socket is empty: clearing first lets a signal
+        # racing the drain set the flag and have its byte eaten by this
+        # loop, leaving the flag stuck with nothing queued. A send_local()
+        # that lands after the last recv and sees the flag still set is
+        # safe, because the bridge drains _local_to_hub on its next pass.
         while True:
             try:
                 chunk = wake_reader.recv(1024)
             except (BlockingIOError, InterruptedError):
-                return
+                break
             except OSError:
-                return
+                break
             if not chunk:
-                return
+                break
+        self._wake_pending = False
 
     def _close_wake_channel(self) -> None:
         with self._wake_lock:
@@ -859,6 +902,9 @@ class TransportBridge:
     # Notifications
     # ------------------------------------------------------------------
     def _notify_hub_state(self, connected: bool) -> None:
+        if not connected:
+            # The link may have dropped because the local route changed.
+            _invalidate_route_cache(self.real_hub_ip)
         for cb in self._hub_state_cbs:
             try:
                 cb(connected)
@@ -20,6 +20,7 @@ import threading
 import time
 from collections import defaultdict, deque
 from dataclasses import replace
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .hub_versions import (
@@ -89,7 +90,7 @@ from .protocol_const import (
     DEVICE_CLASS_WIFI_ROKU,
     DEVICE_CLASS_WIFI_SONOS,
     known_public_device_classes,
-    OPNAMES,
+    opcode_name,
     normalize_device_class,
     opcode_family,
     opcode_lo,
@@ -162,6 +163,7 @@ from .state_helpers import (
     normalize_device_entry,
 )
 from .deframer import Deframer
+from .notify_demuxer import _route_local_ip
 from .transport_bridge import TransportBridge
 from .proxy_restore import RestoreMixin
 from .proxy_wifi_device import WifiDeviceMixin
@@ -241,6 +243,19 @@ def _mdns_instance_for_identity(model: str | None, mdns_txt: Dict[str, str]) ->
     return f"{display_model}-HUB-{_mac_suffix_for_instance(mdns_txt)}"
 
 def _sum8(b: bytes) -> int: return sum(b) & 0xFF
+
+# SYNC0 SYNC1 opcode(be16) — the fixed four-byte head of every wire frame.
+_FRAME_HEAD = struct.Struct(">BBH")
+
+
+@lru_cache(maxsize=512)
+def _build_frame_cached(opcode: int, payload: bytes) -> bytes:
+    """Build a wire frame; polls and button sends repeat the same pairs."""
+
+    frame = _FRAME_HEAD.pack(SYNC0, SYNC1, opcode & 0xFFFF) + payload
+    return frame + bytes((_sum8(frame),))
+
+
 def to_export_view(entry: dict[str, Any]) -> dict[str, Any]:
     """Return a JSON-safe shallow copy of a device / activity entry.
 
@@ -330,30 +345,6 @@ def _normalize_mdns_instance(name: str) -> str:
     normalized = re.sub(r"\s+", "-", name.strip())
     return normalized or "X1-HUB-PROXY"
 
-def _route_local_ip(peer_ip: str) -> str:
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect((peer_ip, 80))
-        return s.getsockname()[0]
-    except Exception:
-        return "127.0.0.1"
-    finally:
-        try: s.close()
-        except Exception: pass
-
-def _pick_port_near(base: int, tries: int = 64) -> int:
-    for i in range(tries):
-        cand = base + i
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            s.bind(("0.0.0.0", cand))
-            s.close()
-            return cand
-        except OSError:
-            continue
-    raise OSError("No free port near %d" % base)
-
 def _enable_keepalive(sock: socket.socket, *, idle: int = 30, interval: int = 10, count: int = 3) -> None:
     try: sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
     except Exception: pass
@@ -464,13 +455,16 @@ class X1Proxy(FrameDecodeMixin, IrBlobMixin, CatalogMixin, ExchangeMixin, AckWai
         self._activity_pending_hint: int | None = None
         self._favorite_label_requests: dict[tuple[int, int], set[int]] = defaultdict(set)
         self._keybinding_label_requests: dict[tuple[int, int], set[int]] = defaultdict(set)
-        self._activity_listeners: list[callable] = []
-        self._activity_list_update_listeners: list[Callable[[], None]] = []
-        self._hub_state_listeners: list[callable] = []
-        self._client_state_listeners: list[callable] = []
-        self._ota_update_listeners: list[callable] = []
-        self._activation_listeners: list[callable] = []
-        self._redundant_off_listeners: list[Callable[[], None]] = []
+        # Listener registries are tuples rebound on registration, so a
+        # notify pass iterates a stable snapshot even if a callback
+        # registers another listener mid-dispatch.
+        self._activity_listeners: tuple[callable, ...] = ()
+        self._activity_list_update_listeners: tuple[Callable[[], None], ...] = ()
+        self._hub_state_listeners: tuple[callable, ...] = ()
+        self._client_state_listeners: tuple[callable, ...] = ()
+        self._ota_update_listeners: tuple[callable, ...] = ()
+        self._activation_listeners: tuple[callable, ...] = ()
+        self._redundant_off_listeners: tuple[Callable[[], None], ...] = ()
         # Set when ACK_READY arrives while the hub is already powered off;
         # resolved by the next active-state evaluation (see
         # handle_active_state). A no-op OFF press is the only known trigger.
@@ -635,7 +629,7 @@ class X1Proxy(FrameDecodeMixin, IrBlobMixin, CatalogMixin, ExchangeMixin, AckWai
     # Local command API
     # ---------------------------------------------------------------------
     def on_activity_list_update(self, cb: Callable[[], None]) -> None:
-        self._activity_list_update_listeners.append(cb)
+        self._activity_list_update_listeners = (*self._activity_list_update_listeners, cb)
 
     def _notify_activity_list_update(self) -> None:
         for cb in self._activity_list_update_listeners:
@@ -685,9 +679,8 @@ class X1Proxy(FrameDecodeMixin, IrBlobMixin, CatalogMixin, ExchangeMixin, AckWai
         return self.transport.can_issue_commands()
 
     def _build_frame(self, opcode: int, payload: bytes = b"") -> bytes:
-        head = bytes([SYNC0, SYNC1, (opcode >> 8) & 0xFF, opcode & 0xFF])
-        frame = head + payload
-        return frame + bytes([_sum8(frame)])
+        # The cache keys on the payload, so mutable buffers are frozen first.
+        return _build_frame_cached(opcode, payload if type(payload) is bytes else bytes(payload))
 
     def _send_family_frame(self, family: int, payload: bytes) -> None:
         opcode = ((len(payload) & 0xFF) << 8) | (family & 0xFF)
@@ -728,29 +721,31 @@ class X1Proxy(FrameDecodeMixin, IrBlobMixin, CatalogMixin, ExchangeMixin, AckWai
             can_issue=self.can_issue_commands,
             sender=self._send_cmd_frame,
         )
+        if not self._log.isEnabledFor(logging.DEBUG):
+            return sent
         if sent:
-            self._log.debug("%s queued %s (0x%04X) %dB", LogTag.CMD, OPNAMES.get(opcode, f"OP_{opcode:04X}"), opcode, len(payload))
+            self._log.debug("%s queued %s (0x%04X) %dB", LogTag.CMD, opcode_name(opcode), opcode, len(payload))
         else:
             self._log.debug(
                 "%s ignoring %s: proxy client is connected",
                 LogTag.CMD,
-                OPNAMES.get(opcode, f"OP_{opcode:04X}"),
+                opcode_name(opcode),
             )
         return sent
 
     def on_hub_state_change(self, cb) -> None:
         """cb(connected: bool)"""
-        self._hub_state_listeners.append(cb)
+        self._hub_state_listeners = (*self._hub_state_listeners, cb)
         cb(self._hub_connected)
 
     def on_client_state_change(self, cb) -> None:
         """cb(connected: bool)"""
-        self._client_state_listeners.append(cb)
+        self._client_state_listeners = (*self._client_state_listeners, cb)
         cb(self._client_connected)
 
     def on_ota_update(self, cb) -> None:
         """cb()  Fired when the hub announces an OTA firmware update (opcode 0x0167)."""
-        self._ota_update_listeners.append(cb)
+        self._ota_update_listeners = (*self._ota_update_listeners, cb)
 
     def notify_ota_in_progress(self) -> None:
         """Dispatch the OTA-in-progress event to registered listeners."""
@@ -763,11 +758,11 @@ class X1Proxy(FrameDecodeMixin, IrBlobMixin, CatalogMixin, ExchangeMixin, AckWai
 
     def on_activity_change(self, cb) -> None:
         """cb(new_id: int | None, old_id: int | None, name: str | None)"""
-        self._activity_listeners.append(cb)
+        self._activity_listeners = (*self._activity_listeners, cb)
 
     def on_redundant_off_press(self, cb: Callable[[], None]) -> None:
         """cb() fired when OFF is pressed while the hub is already powered off."""
-        self._redundant_off_listeners.append(cb)
+        self._redundant_off_listeners = (*self._redundant_off_listeners, cb)
 
     def _notify_redundant_off_press(self) -> None:
         for cb in self._redundant_off_listeners:
@@ -778,7 +773,7 @@ class X1Proxy(FrameDecodeMixin, IrBlobMixin, CatalogMixin, ExchangeMixin, AckWai
 
     def on_app_activation(self, cb) -> None:
         """cb(record: dict[str, Any])"""
-        self._activation_listeners.append(cb)
+        self._activation_listeners = (*self._activation_listeners, cb)
 
     def on_burst_end(self, key: str, cb):
         # key can be:
@@ -1400,13 +1395,13 @@ class X1Proxy(FrameDecodeMixin, IrBlobMixin, CatalogMixin, ExchangeMixin, AckWai
                     page_opcode,
                     len(page_payload),
                 )
-                if self.diag_dump:
+                if self.diag_dump and self._log.isEnabledFor(logging.DEBUG):
                     self._log.debug(
                         "%s save macro page %d/%d payload %s",
                         LogTag.WIRE,
                         seq,
                         len(paged_payloads),
-                        page_payload.hex(" "),
+                        _hexdump(page_payload),
                     )
 
                 send_ts = time.monotonic()
@@ -1619,45 +1614,61 @@ class X1Proxy(FrameDecodeMixin, IrBlobMixin, CatalogMixin, ExchangeMixin, AckWai
     
     def _notify_hub_state(self, connected: bool) -> None:
         self._hub_connected = connected
-        for cb in self._hub_state_listeners:
+        listeners = self._hub_state_listeners
+        if not listeners:
+            return
+        log_exception = self._log.exception
+        for cb in listeners:
             try:
                 cb(connected)
             except Exception:
-                self._log.exception("hub state listener failed")
+                log_exception("hub state listener failed")
 
     def _notify_client_state(self, connected: bool) -> None:
         self._client_connected = connected
-        for cb in self._client_state_listeners:
-            try:
-                cb(connected)
-            except Exception:
-                self._log.exception("client state listener failed")
+        listeners = self._client_state_listeners
+        if listeners:
+            log_exception = self._log.exception
+            for cb in listeners:
+                try:
+                    cb(connected)
+                except Exception:
+                    log_exception("client state listener failed")
         if not connected:
             self._clear_app_device_retry()
 
     
     def _notify_activity_change(self, new_id: int | None, old_id: int | None) -> None:
+        listeners = self._activity_listeners
+        if not listeners:
+            return
         name = None
         if new_id is not None:
             name = self.state.entities("activity").get(new_id & 0xFF, {}).get("name")
-        for cb in self._activity_listeners:
+        log_exception = self._log.exception
+        for cb in listeners:
             try:
                 cb(new_id, old_id, name)
             except Exception:
-                self._log.exception("activity listener failed")
+                log_exception("activity listener failed")
 
     def _notify_app_activation(self, record: dict[str, Any]) -> None:
-        for cb in self._activation_listeners:
+        listeners = self._activation_listeners
+        if not listeners:
+            return
+        log_exception = self._log.exception
+        for cb in listeners:
             try:
                 cb(record)
             except Exception:
-                self._log.exception("app activation listener failed")
+                log_exception("app activation listener failed")
 
     def _on_commands_burst_end(self, key: str) -> None:
-        parts = key.split(":")
-        if len(parts) >= 2 and parts[0] == "commands":
+        head, sep, rest = key.partition(":")
+        if sep and head == "commands":
+            ent_str, sep2, cmd_str = rest.partition(":")
             try:
-                ent_lo = int(parts[1])
+                ent_lo = int(ent_str)
             except ValueError:
                 self._pending_command_requests.clear(); return
 
@@ -1666,9 +1677,9 @@ class X1Proxy(FrameDecodeMixin, IrBlobMixin, CatalogMixin, ExchangeMixin, AckWai
                 return
 
             targeted_cmd: int | None = None
-            if len(parts) >= 3:
+            if sep2:
                 try:
-                    targeted_cmd = int(parts[2])
+                    targeted_cmd = int(cmd_str)
                 except ValueError:
                     targeted_cmd = None
 
@@ -1686,12 +1697,13 @@ class X1Proxy(FrameDecodeMixin, IrBlobMixin, CatalogMixin, ExchangeMixin, AckWai
             self._pending_command_requests.clear()
 
     def _on_ir_dump_burst_end(self, key: str) -> None:
-        parts = key.split(":")
-        if len(parts) < 3 or parts[0] != "ir_dump":
+        head, sep, rest = key.partition(":")
+        dev_str, sep2, cmd_str = rest.partition(":")
+        if not sep2 or head != "ir_dump":
             return
 
         try:
-            request_key = (int(parts[1]) & 0xFF, int(parts[2]) & 0xFF)
+            request_key = (int(dev_str) & 0xFF, int(cmd_str) & 0xFF)
         except ValueError:
             return
 
@@ -1703,10 +1715,10 @@ class X1Proxy(FrameDecodeMixin, IrBlobMixin, CatalogMixin, ExchangeMixin, AckWai
             pending["event"].set()
 
     def _on_macros_burst_end(self, key: str) -> None:
-        parts = key.split(":")
-        if len(parts) >= 2 and parts[0] == "macros":
+        head, sep, rest = key.partition(":")
+        if sep and head == "macros":
             try:
-                act_lo = int(parts[1])
+                act_lo = int(rest.partition(":")[0])
             except ValueError:
                 self._pending_macro_requests.clear()
                 return
@@ -1717,10 +1729,10 @@ class X1Proxy(FrameDecodeMixin, IrBlobMixin, CatalogMixin, ExchangeMixin, AckWai
             self._pending_macro_requests.clear()
 
     def _on_activity_map_burst_end(self, key: str) -> None:
-        parts = key.split(":")
-        if len(parts) >= 2 and parts[0] == "activity_map":
+        head, sep, rest = key.partition(":")
+        if sep and head == "activity_map":
             try:
-                act_lo = int(parts[1])
+                act_lo = int(rest.partition(":")[0])
             except ValueError:
                 self._pending_activity_map_requests.clear()
                 return
@@ -1731,9 +1743,10 @@ class X1Proxy(FrameDecodeMixin, IrBlobMixin, CatalogMixin, ExchangeMixin, AckWai
             self._pending_activity_map_requests.clear()
 
     def _on_buttons_burst_end(self, key: str) -> None:
-        if ":" in key:
+        _head, sep, rest = key.partition(":")
+        if sep:
             try:
-                ent_lo = int(key.split(":", 1)[1])
+                ent_lo = int(rest)
                 self._pending_button_requests.discard(ent_lo)
                 self._button_burst_expected_frames.pop(ent_lo, None)
             except ValueError:
@@ -1780,15 +1793,17 @@ class X1Proxy(FrameDecodeMixin, IrBlobMixin, CatalogMixin, ExchangeMixin, AckWai
             is_retry = self._activity_retry_send_pending
             self._activity_retry_send_pending = False
             self._begin_activity_request(is_retry=is_retry)
-        self._log.debug(
-            "%s hub %s (0x%04X) %dB",
-            LogTag.SEND,
-            OPNAMES.get(opcode, f"OP_{opcode:04X}"),
-            opcode,
-            len(payload),
-        )
+        debug_enabled = self._log.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            self._log.debug(
+                "%s hub %s (0x%04X) %dB",
+                LogTag.SEND,
+                opcode_name(opcode),
+                opcode,
+                len(payload),
+            )
         self.transport.send_local(frame)
-        if self.diag_dump:
+        if self.diag_dump and debug_enabled:
             self._log.debug("%s A→H %s", LogTag.WIRE, _hexdump(frame))
 
     # ---------------------------------------------------------------------
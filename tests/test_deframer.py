@@ -6,6 +6,7 @@ Covers the opcode-hi length invariant documented in
 
 from __future__ import annotations
 
+from custom_components.sofabaton_x1s.lib.deframer import _find_sync
 from custom_components.sofabaton_x1s.lib.protocol_const import SYNC0, SYNC1
 from custom_components.sofabaton_x1s.lib.x1_proxy import Deframer
 
@@ -35,6 +36,29 @@ def test_emits_single_zero_payload_frame():
     assert start_cid == 1 and end_cid == 1
 
 
+def test_single_frame_read_is_emitted_without_copy():
+    d = Deframer()
+    frame = _frame(0x023C, b"\x10\xFF")
+    out = d.feed(frame, cid=1)
+    assert out[0][1] is frame
+    assert out[0][2] == b"\x10\xFF"
+
+
+def test_accepts_views_into_a_reused_receive_buffer():
+    d = Deframer()
+    frame = _frame(0x023C, b"\x10\xFF")
+    recv_buf = bytearray(64)
+    recv_buf[: len(frame)] = frame
+    out = d.feed(memoryview(recv_buf)[:5], cid=1)
+    assert out == []
+    recv_buf[: len(frame) - 5] = frame[5:]
+    out = d.feed(memoryview(recv_buf)[: len(frame) - 5], cid=2)
+    recv_buf[:] = bytes(64)  # caller reuses the buffer
+    assert len(out) == 1
+    assert out[0][1] == frame
+    assert type(out[0][1]) is bytes
+
+
 def test_emits_two_back_to_back_frames():
     d = Deframer()
     f1 = _frame(0x023C, b"\x10\xFF")
@@ -75,6 +99,15 @@ def test_partial_frame_split_across_reads():
     assert end_cid == 12
 
 
+def test_buffer_keeps_only_the_trailing_partial_frame():
+    d = Deframer()
+    frames = b"".join(_frame(0x023C, b"\x10\xFF") for _ in range(500))
+    tail = _frame(0x0400, b"\x01\x02\x03\x04")[:6]
+    out = d.feed(frames + tail, cid=1)
+    assert len(out) == 500
+    assert bytes(d.buf) == tail
+
+
 def test_junk_before_sync_is_discarded():
     d = Deframer()
     frame = _frame(0x0001, b"")
@@ -118,7 +151,7 @@ def test_resync_recovers_after_garbage_with_embedded_sync():
 
 
 def test_buffer_cap_does_not_split_aligned_frames():
-    """Even with the 1 MB safety cap, aligned frames after the cap still decode."""
+    """A megabyte of junk is discarded and the next aligned frame decodes."""
 
     d = Deframer()
     frame = _frame(0x0001, b"")
@@ -127,3 +160,19 @@ def test_buffer_cap_does_not_split_aligned_frames():
     out = d.feed(frame, cid=2)
     assert len(out) == 1
     assert out[0][1] == frame
+
+
+def test_find_sync_skips_lone_sync0_bytes():
+    buf = bytearray([0x00, SYNC0, 0x00, SYNC0, SYNC0, SYNC1, 0x01, SYNC0])
+    assert _find_sync(buf) == 4
+    assert _find_sync(buf, 5) == -1  # trailing SYNC0 without its partner
+    assert _find_sync(b"") == -1
+
+
+def test_oversized_read_keeps_every_frame():
+    d = Deframer()
+    frame = _frame(0x023C, b"\x10\xFF")
+    count = 1_000_001 // len(frame) + 1
+    out = d.feed(frame * count, cid=1)
+    assert len(out) == count
+    assert d.buf == bytearray()
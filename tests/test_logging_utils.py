@@ -54,6 +54,32 @@ def test_hub_logger_prefixes_once_and_supports_legacy_placeholder():
     ]
 
 
+def test_hub_logger_skips_formatting_below_logger_level(monkeypatch):
+    from custom_components.sofabaton_x1s.lib import hub_logging
+
+    logger = logging.getLogger("tests.hub_logger_level")
+    handler = _CaptureHandler()
+    logger.handlers = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    formatted = []
+    real_format = hub_logging.format_hub_log_message
+
+    def _spy(entry_id, message):
+        formatted.append(message)
+        return real_format(entry_id, message)
+
+    monkeypatch.setattr(hub_logging, "format_hub_log_message", _spy)
+
+    hub_log = get_hub_logger(logger, "entry-1")
+    hub_log.debug("[FRAME] dropped %s", "x")
+    hub_log.info("[CMD] kept")
+
+    assert formatted == ["[CMD] kept"]
+    assert handler.messages == ["[entry-1] [CMD] kept"]
+
+
 def test_extract_hub_log_entry_id_only_accepts_canonical_leading_prefix():
     assert extract_hub_log_entry_id("[entry-1] [TCP] connected") == "entry-1"
     assert extract_hub_log_entry_id("[TCP] connected [entry-1]") is None
@@ -1,7 +1,7 @@
 import socket
 import struct
 
-from custom_components.sofabaton_x1s.lib.notify_demuxer import NotifyDemuxer
+from custom_components.sofabaton_x1s.lib.notify_demuxer import NOTIFY_ME_PAYLOAD, NotifyDemuxer
 from custom_components.sofabaton_x1s.lib.protocol_const import OP_CALL_ME, SYNC0, SYNC1
 
 
@@ -119,3 +119,53 @@ def test_notify_reply_x2_matches_hub_format():
     assert reply == bytes.fromhex(
         "a55a15c2fc012c39d39064032022112008010058322048554207"
     )
+
+
+def test_notify_loop_drains_queued_datagrams_per_wake():
+    demux = NotifyDemuxer()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.setblocking(False)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        for idx in range(3):
+            sender.sendto(bytes([idx]), sock.getsockname())
+
+        seen = []
+
+        def record(_sock, pkt, _src_ip, _src_port):
+            seen.append(bytes(pkt))
+            if len(seen) == 3:
+                demux._stop_event.set()
+
+        demux._sock = sock
+        demux._handle_datagram = record  # type: ignore[assignment]
+        demux._notify_loop()
+
+        assert seen == [b"\x00", b"\x01", b"\x02"]
+    finally:
+        sender.close()
+        sock.close()
+
+
+def test_handle_datagram_classifies_views_into_the_receive_buffer():
+    demux = NotifyDemuxer()
+    notify_me = []
+    call_me = []
+    demux._handle_notify_me = lambda _sock, pkt, *_: notify_me.append(pkt)  # type: ignore[assignment]
+    demux._handle_call_me = lambda pkt, *_: call_me.append(pkt)  # type: ignore[assignment]
+
+    buf = bytearray(64)
+    pkt = _build_call_me(bytes.fromhex("aabbccddee45"), "10.0.0.5", 1234)
+    buf[: len(pkt)] = pkt
+    demux._handle_datagram(None, memoryview(buf)[: len(pkt)], "10.0.0.5", 5678)
+
+    buf[:5] = b"\x00" * 5
+    demux._handle_datagram(None, memoryview(buf)[:5], "10.0.0.5", 5678)
+
+    buf[:5] = NOTIFY_ME_PAYLOAD
+    demux._handle_datagram(None, memoryview(buf)[:5], "10.0.0.5", 5678)
+
+    assert call_me == [pkt]
+    assert type(call_me[0]) is bytes
+    assert notify_me == [NOTIFY_ME_PAYLOAD]
@@ -35,7 +35,12 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from custom_components.sofabaton_x1s.lib.frame_handlers import FrameContext
+from custom_components.sofabaton_x1s.lib.frame_handlers import (
+    BaseFrameHandler,
+    FrameContext,
+    FrameHandlerRegistry,
+    register_handler,
+)
 from custom_components.sofabaton_x1s.lib import opcode_handlers
 from custom_components.sofabaton_x1s.lib.opcode_handlers import (
     ActivityMapHandler,
@@ -1305,6 +1310,13 @@ def test_decode_x1s_activity_label_handles_odd_length_safely() -> None:
     assert _decode_x1s_activity_label(b"\x00\x57\x00") == "W"
 
 
+def test_decode_x1s_activity_label_reads_slot_bounds_inside_frame() -> None:
+    slot = "Watch TV".encode("utf-16-be").ljust(60, b"\x00")
+    raw = b"\x01" * 36 + slot + "Next".encode("utf-16-be")
+    assert _decode_x1s_activity_label(raw, 36, 96) == "Watch TV"
+    assert _decode_x1s_activity_label(raw[:41], 36, 96) == "Wa"
+
+
 def test_decode_x1s_needs_confirm_flag_true_at_tail_marker() -> None:
     payload = bytearray(214)
     # Tail region: payload[152..212). Place fc XX fc YY near the end of it.
@@ -1707,3 +1719,32 @@ def test_ack_ready_with_proxy_client_fires_redundant_off_directly() -> None:
     handler = AckReadyHandler()
     handler.handle(_build_payload_context(proxy, OP_ACK_READY, b"\x00", "ACK_READY"))
     assert fired == ["off"]
+
+
+def test_registry_dispatch_table_is_rebuilt_after_register() -> None:
+    registry = FrameHandlerRegistry()
+
+    @register_handler(opcodes=(0x0103,), directions=("H→A",), registry=registry)
+    class _First(BaseFrameHandler):
+        def handle(self, frame: FrameContext) -> None:
+            pass
+
+    assert [type(h) for h in registry.handlers_for(0x0103, "H→A")] == [_First]
+    assert registry.handlers_for(0x0103, "A→H") == ()
+
+    @register_handler(opcodes=(0x0103,), registry=registry)
+    class _Second(BaseFrameHandler):
+        def handle(self, frame: FrameContext) -> None:
+            pass
+
+    assert [type(h) for h in registry.handlers_for(0x0103, "H→A")] == [_First, _Second]
+    assert [type(h) for h in registry.iter_for(0x0103, "A→H")] == [_Second]
+
+
+def test_nul_terminated_slices_up_to_first_nul_within_bounds():
+    buf = b"\x00\x00AB\x00CD"
+
+    assert opcode_handlers._nul_terminated(buf, 2) == b"AB"
+    assert opcode_handlers._nul_terminated(buf, 2, 3) == b"A"
+    assert opcode_handlers._nul_terminated(buf, 5) == b"CD"
+    assert opcode_handlers._nul_terminated(buf, 20, 30) == b""
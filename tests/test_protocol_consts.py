@@ -72,3 +72,18 @@ def test_req_buttons_opnames_use_role_oriented_labels() -> None:
     assert const.OPNAMES[const.OP_KEYMAP_FINAL_X1S] == "REQ_BUTTONS_FINAL_X1S_X2_233D"
     assert const.OPNAMES[const.OP_KEYMAP_PAGE_X2_C03D] == "REQ_BUTTONS_PAGE_X1S_X2_C03D"
     assert const.OPNAMES[const.OP_KEYMAP_OVERLAY_X1] == "REQ_BUTTONS_OVERLAY_X1"
+
+
+def test_opcode_name_falls_back_without_touching_opnames() -> None:
+    assert const.opcode_name(const.OP_CALL_ME) == "CALL_ME"
+    unknown = 0xFEFE
+    assert unknown not in const.OPNAMES
+    assert const.opcode_name(unknown) == "OP_FEFE"
+    assert const.opcode_name(unknown) is const.opcode_name(unknown)
+    assert unknown not in const.OPNAMES
+
+
+def test_button_name_matches_buttonname_by_code_for_every_byte() -> None:
+    for code in range(256):
+        assert const.button_name(code) == const.BUTTONNAME_BY_CODE.get(code)
+    assert const.button_name(const.ButtonName.POWER_ON) == "POWER_ON"
@@ -37,6 +37,23 @@ def test_burst_scheduler_drains_queue_and_notifies() -> None:
     assert notifications == ["foo"]
 
 
+def test_burst_scheduler_notifies_prefix_listeners_registered_after_first_end() -> None:
+    notifications: list[tuple[str, str]] = []
+
+    scheduler = BurstScheduler()
+    scheduler.on_burst_end("buttons:101", lambda key: notifications.append(("exact", key)))
+    scheduler._notify_burst_end("buttons:101")
+
+    scheduler.on_burst_end("buttons", lambda key: notifications.append(("prefix", key)))
+    scheduler._notify_burst_end("buttons:101")
+
+    assert notifications == [
+        ("exact", "buttons:101"),
+        ("exact", "buttons:101"),
+        ("prefix", "buttons:101"),
+    ]
+
+
 def test_burst_scheduler_tick_never_drains_exchange_pseudo_burst() -> None:
     """An ``exchange:`` pseudo-burst is exempt from the idle tick.
 
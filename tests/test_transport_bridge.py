@@ -229,10 +229,40 @@ def test_send_local_wakes_bridge_immediately(monkeypatch):
 
     bridge.send_local(b"abc")
 
-    assert bridge._local_to_hub == bytearray(b"abc")
+    assert b"".join(bridge._local_to_hub) == b"abc"
     assert signals == [b"\x00"]
 
 
+def test_send_local_coalesces_wakes_until_drained():
+    signals = []
+
+    class FakeWakeSocket:
+        def send(self, data):
+            signals.append(data)
+            return len(data)
+
+        def recv(self, _size):
+            raise BlockingIOError()
+
+        def close(self):
+            pass
+
+    bridge = TransportBridge(
+        "192.168.2.10", 8102, 8102, 8200, proxy_id="proxy", mdns_instance="proxy", mdns_txt={}
+    )
+    bridge._wake_writer = FakeWakeSocket()
+
+    bridge.send_local(b"a")
+    bridge.send_local(b"b")
+    assert signals == [b"\x00"]
+
+    bridge._drain_wake_socket(FakeWakeSocket())
+    bridge.send_local(b"c")
+
+    assert b"".join(bridge._local_to_hub) == b"abc"
+    assert signals == [b"\x00", b"\x00"]
+
+
 def test_drain_wake_socket_reads_until_blocking():
     class FakeWakeReader:
         def __init__(self):
@@ -254,6 +284,41 @@ def test_drain_wake_socket_reads_until_blocking():
     assert reader.calls == 2
 
 
+def test_signal_during_drain_does_not_lose_later_wakes():
+    import select
+
+    bridge = TransportBridge(
+        "192.168.2.10", 8102, 8102, 8200, proxy_id="proxy", mdns_instance="proxy", mdns_txt={}
+    )
+    bridge._init_wake_channel()
+    try:
+        reader = bridge._wake_reader
+        bridge.send_local(b"a")
+
+        class RacingReader:
+            """Real reader that lets a producer signal mid-drain."""
+
+            raced = False
+
+            def recv(self, size):
+                data = reader.recv(size)
+                if not self.raced:
+                    self.raced = True
+                    bridge.send_local(b"b")
+                return data
+
+        bridge._drain_wake_socket(RacingReader())
+        assert bridge._wake_pending is False
+
+        bridge.send_local(b"c")
+
+        readable, _, _ = select.select([reader], [], [], 0)
+        assert readable == [reader]
+        assert b"".join(bridge._local_to_hub) == b"abc"
+    finally:
+        bridge._close_wake_channel()
+
+
 def test_stop_closes_wake_channel_safely():
     closed = []
 
@@ -278,3 +343,100 @@ def test_stop_closes_wake_channel_safely():
     assert closed == ["reader", "writer"]
     assert bridge._wake_reader is None
     assert bridge._wake_writer is None
+
+
+def test_route_local_ip_is_cached_until_invalidated(monkeypatch):
+    probes = []
+
+    class FakeUdpSocket:
+        def __init__(self, *_args):
+            pass
+
+        def connect(self, addr):
+            probes.append(addr[0])
+
+        def getsockname(self):
+            return ("192.168.2.50", 40000)
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(transport_bridge.socket, "socket", FakeUdpSocket)
+    transport_bridge._invalidate_route_cache("192.168.2.10")
+
+    assert transport_bridge._route_local_ip("192.168.2.10") == "192.168.2.50"
+    assert transport_bridge._route_local_ip("192.168.2.10") == "192.168.2.50"
+    assert probes == ["192.168.2.10"]
+
+    transport_bridge._invalidate_route_cache("192.168.2.10")
+    assert transport_bridge._route_local_ip("192.168.2.10") == "192.168.2.50"
+    assert probes == ["192.168.2.10", "192.168.2.10"]
+
+
+def test_hub_down_event_tracks_socket_swaps():
+    class FakeSocket:
+        def settimeout(self, _value):
+            pass
+
+        def setsockopt(self, *_args):
+            pass
+
+        def shutdown(self, _how):
+            pass
+
+        def close(self):
+            pass
+
+    bridge = TransportBridge(
+        "192.168.2.10", 8102, 8102, 8200, proxy_id="proxy", mdns_instance="proxy", mdns_txt={}
+    )
+    assert bridge._hub_down.is_set()
+
+    bridge._install_hub_socket(FakeSocket(), ("192.168.2.10", 51235))
+    assert not bridge._hub_down.is_set()
+
+    bridge.pause_for_ota(0)
+    assert bridge._hub_sock is None
+    assert bridge._hub_down.is_set()
+
+
+def test_call_me_loop_does_not_spin_when_connected_with_event_set(monkeypatch):
+    import threading
+    import time
+
+    class FakeUdp:
+        def sendto(self, *_args):
+            pass
+
+        def close(self):
+            pass
+
+    class CountingLock:
+        def __init__(self):
+            self.acquires = 0
+            self._lock = threading.Lock()
+
+        def __enter__(self):
+            self.acquires += 1
+            return self._lock.__enter__()
+
+        def __exit__(self, *exc):
+            return self._lock.__exit__(*exc)
+
+    monkeypatch.setattr(transport_bridge.socket, "socket", lambda *a, **k: FakeUdp())
+
+    bridge = TransportBridge(
+        "192.168.2.10", 8102, 8102, 8200, proxy_id="proxy", mdns_instance="proxy", mdns_txt={}
+    )
+    bridge._hub_lock = CountingLock()
+    bridge._hub_sock = object()  # connected, but _hub_down is still set
+    assert bridge._hub_down.is_set()
+
+    thread = threading.Thread(target=bridge._call_me_loop, daemon=True)
+    thread.start()
+    time.sleep(0.5)
+    bridge._stop.set()
+    thread.join(timeout=2.0)
+
+    assert not thread.is_alive()
+    assert bridge._hub_lock.acquires < 10
@@ -869,6 +869,65 @@ def test_start_mdns_advertises_x1_service_for_x2_hub(monkeypatch) -> None:
     assert proxy._adv_started is True
 
 
+def test_start_mdns_reuses_cached_route_within_ttl(monkeypatch) -> None:
+    from custom_components.sofabaton_x1s.lib import notify_demuxer
+
+    probes: list[str] = []
+
+    class DummyServiceInfo:
+        def __init__(self, *, type_, name, addresses, port, properties, server):
+            self.type = type_
+            self.name = name
+            self.addresses = addresses
+
+    class DummyZeroconf:
+        def __init__(self, *_args, **_kwargs):
+            pass
+
+        def register_service(self, info):
+            pass
+
+        def unregister_service(self, info):
+            pass
+
+        def close(self):
+            pass
+
+    class DummyIPVersion:
+        V4Only = object()
+
+    class FakeUdpSocket:
+        def __init__(self, *_args):
+            pass
+
+        def connect(self, addr):
+            probes.append(addr[0])
+
+        def getsockname(self):
+            return ("192.0.2.50", 40000)
+
+        def close(self):
+            pass
+
+    zc_module = types.ModuleType("zeroconf")
+    zc_module.BadTypeInNameException = Exception
+    zc_module.NonUniqueNameException = Exception
+    zc_module.IPVersion = DummyIPVersion
+    zc_module.ServiceInfo = DummyServiceInfo
+    zc_module.Zeroconf = DummyZeroconf
+    monkeypatch.setitem(sys.modules, "zeroconf", zc_module)
+
+    proxy = X1Proxy("192.0.2.10", proxy_enabled=True, diag_dump=False, diag_parse=False)
+    monkeypatch.setattr(notify_demuxer.socket, "socket", FakeUdpSocket)
+    notify_demuxer._invalidate_route_cache("192.0.2.10")
+
+    proxy._start_mdns()
+    proxy._start_mdns()
+
+    assert probes == ["192.0.2.10"]
+    notify_demuxer._invalidate_route_cache("192.0.2.10")
+
+
 def test_update_discovery_identity_uses_model_hub_mac_suffix_instance() -> None:
     proxy = X1Proxy("127.0.0.1", proxy_enabled=True, diag_dump=False, diag_parse=False)
 